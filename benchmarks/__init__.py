@@ -0,0 +1 @@
+from .suite import SIZES, LoopLagMonitor, run_suite, compare_results
@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import json
+
+from core.constants import VERSION
+from core.visuals import Display
+
+from .suite import SIZES, run_suite, compare_results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks the load, hydrate and sell hot paths against the mock server")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["1k", "10k"],
+                        help="synthetic inventory sizes in collectibles")
+    parser.add_argument("--sample", type=int, default=200, help="items used for the per item benchmarks")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every mock response")
+    parser.add_argument("--unthrottled", action="store_true", help="disable the client side rate limiter")
+    parser.add_argument("--output", default=f"benchmark_v{VERSION}.json", help="where to write the json results")
+    parser.add_argument("--compare", default=None, help="previous results file to compare against")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_suite(args.sizes, sample=args.sample, latency=args.latency,
+                                    unthrottled=args.unthrottled))
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=4)
+
+    Display.success(f"Saved benchmark results to [g{args.output}]")
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+        for line in compare_results(previous, results):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
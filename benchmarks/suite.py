@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+import asyncio
+import json
+import socket
+import os
+import sys
+import tempfile
+import time
+
+from typing import Optional, List, Dict, AsyncIterator, TYPE_CHECKING
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+if TYPE_CHECKING:
+    from main import AutoSeller
+
+from core.clients import ClientSession, sessions
+from core.constants import VERSION
+from core.metrics import metrics
+from core.utils import FileSync
+
+__all__ = ("SIZES", "LoopLagMonitor", "run_suite", "compare_results")
+
+SIZES = {"1k": (200, 5), "10k": (2_000, 5), "100k": (20_000, 5)}
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.max_lag = max(self.max_lag, loop.time() - started - self.interval)
+
+    def start(self) -> None:
+        self.max_lag = 0.0
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> float:
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        return self.max_lag
+
+
+@asynccontextmanager
+async def mock_marketplace(items: int, copies: int, latency: float, *,
+                           timeout: float = 30) -> AsyncIterator[str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "mock_server", "--port", str(port),
+        "--items", str(items), "--copies", str(copies), "--latency", str(latency),
+        cwd=ROOT, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+    )
+
+    try:
+        deadline = time.monotonic() + timeout
+
+        while True:
+            if process.returncode is not None:
+                raise RuntimeError(f"Mock marketplace exited with code {process.returncode}")
+
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("Mock marketplace did not start in time")
+
+                await asyncio.sleep(0.05)
+                continue
+
+            writer.close()
+            await writer.wait_closed()
+            break
+
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        if process.returncode is None:
+            process.terminate()
+
+        await process.wait()
+
+
+class Bench:
+    def __init__(self) -> None:
+        self.results: Dict[str, dict] = {}
+        self.monitor = LoopLagMonitor()
+
+    @asynccontextmanager
+    async def measure(self, name: str, **extra) -> AsyncIterator[dict]:
+        requests_before = metrics.total_requests
+        self.monitor.start()
+        started = time.perf_counter()
+
+        result = dict(extra)
+        yield result
+
+        wall_time = time.perf_counter() - started
+        result.update({
+            "wall_time": round(wall_time, 4),
+            "requests": metrics.total_requests - requests_before,
+            "peak_rss": peak_rss(),
+            "max_loop_lag": round(await self.monitor.stop(), 4)
+        })
+        self.results.update({name: result})
+
+
+def make_seller(config: dict, directory: str) -> AutoSeller:
+    from main import AutoSeller
+
+    files = []
+    for name in ("blacklist", "seen", "not_resable"):
+        path = os.path.join(directory, f"{name}.json")
+
+        with open(path, "w") as f:
+            json.dump([], f)
+
+        files.append(FileSync(path))
+
+    return AutoSeller(config, *files)
+
+
+async def run_size(size: str, config: dict, *, sample: int, latency: float,
+                   unthrottled: bool) -> Dict[str, dict]:
+    items, copies = SIZES[size]
+    bench = Bench()
+
+    async with mock_marketplace(items, copies, latency) as url:
+        ClientSession.mock_url = url
+
+        with tempfile.TemporaryDirectory() as directory:
+            seller = make_seller(config, directory)
+
+            if unthrottled:
+                seller.auth.rate_limiter = None
+
+            try:
+                await seller.auth.fetch_csrf_token()
+                await seller.auth.fetch_user_info()
+
+                async with bench.measure("load_items", collectibles=items * copies):
+                    await seller._load_items()
+
+                sampled = seller.upcoming_items(sample)
+
+                async with bench.measure("fetch_collectibles", items=len(sampled)):
+                    await asyncio.gather(*(item.fetch_collectibles() for item in sampled))
+
+                async with bench.measure("fetch_resales", items=len(sampled)):
+                    await asyncio.gather(*(item.fetch_resales() for item in sampled))
+
+                async with bench.measure("fetch_sales", items=len(sampled)):
+                    await asyncio.gather(*(item.fetch_sales() for item in sampled))
+
+                async with bench.measure("define_sale_price", items=len(seller.items)):
+                    seller.pricing.price_many(seller.items)
+
+                async with bench.measure("sell_collectibles", items=len(sampled)) as result:
+                    sold = await asyncio.gather(*(
+                        item.sell_collectibles(verbose=False, concurrency=seller.sell_concurrency)
+                        for item in sampled
+                    ))
+                    result.update({"sold": sum(filter(None, sold))})
+            finally:
+                await seller.auth.close_session()
+                await sessions.close()
+
+    return bench.results
+
+
+async def run_suite(sizes: List[str], *, sample: int = 200, latency: float = 0.0,
+                    unthrottled: bool = False) -> dict:
+    with open("config.json") as f:
+        config = json.load(f)
+
+    config.update({"Cookie": "benchmark", "Discord_Rich_Presence": False})
+    config["Auto_Sell"].update({"Ask_Before_Sell": False})
+
+    results = {}
+
+    for size in sizes:
+        results.update({size: await run_size(size, config, sample=sample, latency=latency,
+                                             unthrottled=unthrottled)})
+
+    return {
+        "version": VERSION,
+        "python": sys.version.split()[0],
+        "created": int(time.time()),
+        "settings": {"sample": sample, "latency": latency, "unthrottled": unthrottled},
+        "results": results
+    }
+
+
+def compare_results(old: dict, new: dict) -> List[str]:
+    lines = []
+
+    for size, benches in new["results"].items():
+        for name, result in benches.items():
+            previous = old["results"].get(size, {}).get(name)
+            if previous is None:
+                continue
+
+            for metric in ("wall_time", "requests", "peak_rss", "max_loop_lag"):
+                before, after = previous.get(metric), result.get(metric)
+                if not before or after is None:
+                    continue
+
+                change = (after - before) / before * 100
+                lines.append(f"{size} {name} {metric}: {before} -> {after} ({change:+.1f}%)")
+
+    return lines
@@ -0,0 +1,239 @@
+import threading
+import asyncio
+import sqlite3
+import json
+import time
+
+from typing import Optional, Dict, Iterable, List, Hashable, Callable, Awaitable, Any
+
+from .constants import FAILED_IMAGE_URL
+from .utils import slice_list
+
+__all__ = ("CatalogCache", "TTLCache")
+
+
+class CatalogCache:
+    VOLATILE_FIELDS = ("price", "lowestPrice", "lowestResalePrice", "unitsAvailableForConsumption")
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        details_ttl: float = 7 * 24 * 60 * 60,
+        volatile_ttl: float = 10 * 60,
+        thumbnail_ttl: float = 7 * 24 * 60 * 60,
+        batch_size: int = 1000
+    ) -> None:
+        self.filename = filename
+        self.details_ttl = details_ttl
+        self.volatile_ttl = volatile_ttl
+        self.thumbnail_ttl = thumbnail_ttl
+        self.batch_size = batch_size
+
+        self._details_rows: List[tuple] = []
+        self._volatile_rows: List[tuple] = []
+        self._thumbnail_rows: List[tuple] = []
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(filename, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS assets ("
+            "asset_id TEXT PRIMARY KEY, "
+            "details TEXT, details_updated REAL, "
+            "volatile TEXT, volatile_updated REAL, "
+            "thumbnail TEXT, thumbnail_updated REAL)"
+        )
+        self._db.commit()
+
+    def _select(self, columns: str, asset_ids: List[str]) -> List[tuple]:
+        rows = []
+
+        with self._lock:
+            for chunk in slice_list(asset_ids, 500):
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self._db.execute(
+                    f"SELECT asset_id, {columns} FROM assets WHERE asset_id IN ({placeholders})", chunk
+                ).fetchall())
+
+        return rows
+
+    @property
+    def pending(self) -> int:
+        return len(self._details_rows) + len(self._volatile_rows) + len(self._thumbnail_rows)
+
+    async def get_details(self, asset_ids: Iterable[str]) -> tuple[Dict[str, dict], Dict[str, dict]]:
+        return await asyncio.to_thread(self._get_details, list(asset_ids))
+
+    async def get_thumbnails(self, asset_ids: Iterable[str]) -> Dict[str, str]:
+        return await asyncio.to_thread(self._get_thumbnails, list(asset_ids))
+
+    def _get_details(self, asset_ids: List[str]) -> tuple[Dict[str, dict], Dict[str, dict]]:
+        now = time.time()
+        fresh, stale_volatile = {}, {}
+
+        for asset_id, details, details_updated, volatile, volatile_updated in self._select(
+            "details, details_updated, volatile, volatile_updated", asset_ids
+        ):
+            if details is None or now - details_updated > self.details_ttl:
+                continue
+
+            details = json.loads(details)
+
+            if volatile is not None and now - volatile_updated <= self.volatile_ttl:
+                details.update(json.loads(volatile))
+                fresh.update({asset_id: details})
+            else:
+                stale_volatile.update({asset_id: details})
+
+        return fresh, stale_volatile
+
+    def _get_thumbnails(self, asset_ids: List[str]) -> Dict[str, str]:
+        now = time.time()
+
+        return {
+            asset_id: thumbnail
+            for asset_id, thumbnail, updated in self._select("thumbnail, thumbnail_updated", asset_ids)
+            if thumbnail is not None and now - updated <= self.thumbnail_ttl
+        }
+
+    async def put_details(self, items_details: Dict[str, dict]) -> None:
+        now = time.time()
+
+        for asset_id, details in items_details.items():
+            volatile = {key: details[key] for key in self.VOLATILE_FIELDS if key in details}
+            stable = {key: value for key, value in details.items() if key not in volatile}
+
+            self._details_rows.append((asset_id, json.dumps(stable), now, json.dumps(volatile), now))
+
+        await self._flush_if_full()
+
+    async def put_volatile(self, items_volatile: Dict[str, dict]) -> None:
+        now = time.time()
+
+        self._volatile_rows.extend(
+            (json.dumps({key: volatile[key] for key in self.VOLATILE_FIELDS if key in volatile}), now, asset_id)
+            for asset_id, volatile in items_volatile.items()
+        )
+
+        await self._flush_if_full()
+
+    async def put_thumbnails(self, thumbnails: Dict[str, str]) -> None:
+        now = time.time()
+
+        self._thumbnail_rows.extend((asset_id, thumbnail, now) for asset_id, thumbnail in thumbnails.items()
+                                    if thumbnail != FAILED_IMAGE_URL)
+
+        await self._flush_if_full()
+
+    async def _flush_if_full(self) -> None:
+        if self.pending >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self.pending:
+            await asyncio.to_thread(self._write, *self._take_rows())
+
+    def _take_rows(self) -> tuple[List[tuple], List[tuple], List[tuple]]:
+        rows = (self._details_rows, self._volatile_rows, self._thumbnail_rows)
+        self._details_rows, self._volatile_rows, self._thumbnail_rows = [], [], []
+
+        return rows
+
+    def _write(self, details_rows: List[tuple], volatile_rows: List[tuple], thumbnail_rows: List[tuple]) -> None:
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT INTO assets (asset_id, details, details_updated, volatile, volatile_updated) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(asset_id) DO UPDATE SET "
+                "details = excluded.details, details_updated = excluded.details_updated, "
+                "volatile = excluded.volatile, volatile_updated = excluded.volatile_updated",
+                details_rows
+            )
+            self._db.executemany(
+                "UPDATE assets SET volatile = ?, volatile_updated = ? WHERE asset_id = ?",
+                volatile_rows
+            )
+            self._db.executemany(
+                "INSERT INTO assets (asset_id, thumbnail, thumbnail_updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(asset_id) DO UPDATE SET "
+                "thumbnail = excluded.thumbnail, thumbnail_updated = excluded.thumbnail_updated",
+                thumbnail_rows
+            )
+
+    def clear(self) -> None:
+        self._take_rows()
+
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM assets")
+
+    def close(self) -> None:
+        if self.pending:
+            self._write(*self._take_rows())
+
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+
+class TTLCache:
+    def __init__(self, ttl: float, *, max_size: Optional[int] = 10_000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._entries: Dict[Hashable, tuple[float, Any]] = {}
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return default
+
+        if time.monotonic() - entry[0] > self.ttl:
+            self._entries.pop(key, None)
+            return default
+
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries.pop(key, None)
+        self._entries.update({key: (time.monotonic(), value)})
+
+        if self.max_size is not None and len(self._entries) > self.max_size:
+            self._entries.pop(next(iter(self._entries)))
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._in_flight.get(key)
+
+        if task is None:
+            async def load() -> Any:
+                try:
+                    result = await fetch()
+                finally:
+                    self._in_flight.pop(key, None)
+
+                if result is not None:
+                    self.set(key, result)
+
+                return result
+
+            task = asyncio.create_task(load())
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._in_flight.update({key: task})
+
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
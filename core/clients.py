@@ -1,39 +1,248 @@
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 import asyncio
 import aiohttp
 import inspect
+import time
+import os
 import re
 
-from typing import Optional
+from typing import Optional, Dict, Mapping, Tuple
 
+from .metrics import metrics, endpoint_template
 from .visuals import Display
 
-__all__ = ("ClientSession", "Auth")
+__all__ = ("RateLimiter", "ClientSession", "SessionPool", "sessions", "Auth")
+
+
+class _TokenBucket:
+    __slots__ = ("rate", "tokens", "capacity", "updated", "blocked_until", "strikes", "lock")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.lock = asyncio.Lock()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self.refill(now)
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return None
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: float = 10,
+        *,
+        min_rate: float = 0.5,
+        max_rate: float = 60,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        cooldown: float = 2,
+        max_cooldown: float = 30,
+        retries: int = 3
+    ) -> None:
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.retries = retries
+
+        self._buckets: Dict[str, _TokenBucket] = {}
+
+    def get_bucket(self, host: str) -> _TokenBucket:
+        bucket = self._buckets.get(host)
+
+        if bucket is None:
+            bucket = _TokenBucket(self.rate, self.rate)
+            self._buckets.update({host: bucket})
+
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        await self.get_bucket(host).acquire()
+
+    @staticmethod
+    def _parse_delay(headers: Mapping[str, str]) -> Optional[float]:
+        retry_after = headers.get("Retry-After")
+
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0)
+            except ValueError:
+                pass
+
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+            except (TypeError, ValueError):
+                pass
+
+        if headers.get("x-ratelimit-remaining") == "0":
+            try:
+                return max(float(headers.get("x-ratelimit-reset")), 0)
+            except (TypeError, ValueError):
+                pass
+
+        return None
+
+    def feedback(self, host: str, status: int, headers: Mapping[str, str]) -> None:
+        bucket = self.get_bucket(host)
+        delay = self._parse_delay(headers)
+
+        if status == 429:
+            bucket.strikes += 1
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+
+            if delay is None:
+                delay = min(self.cooldown * 2 ** (bucket.strikes - 1), self.max_cooldown)
+        else:
+            bucket.strikes = 0
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+        bucket.capacity = max(bucket.rate, 1)
+
+        if delay:
+            bucket.tokens = 0
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
 
 
 class ClientSession(aiohttp.ClientSession):
-    def __init__(self, base_url: Optional[str] = None, **kwargs):
+    mock_url: Optional[str] = os.environ.get("AUTOSELLER_MOCK_URL")
+
+    def __init__(self, base_url: Optional[str] = None, *,
+                 rate_limiter: Optional[RateLimiter] = None, **kwargs):
         # noinspection PyTypeChecker
-        kwargs.update({
-            "connector": aiohttp.TCPConnector(limit=None, ssl=False),
-            "trust_env": True,
-        })
+        if "connector" not in kwargs:
+            kwargs.update({"connector": aiohttp.TCPConnector(limit=None, ssl=False)})
+
+        kwargs.update({"trust_env": True,
+                       "trace_configs": [*kwargs.get("trace_configs", ()), metrics.trace_config()]})
 
         super().__init__(base_url, **kwargs)
 
-    def _request(self, method: str, url: str, **kwargs):
-        kwargs.update({"ssl": False})
+        self.rate_limiter = rate_limiter
 
+    @staticmethod
+    def _split_url(method: str, url: str) -> Tuple[str, str, str]:
         if re.match(r"\Ahttps?://", url) is None:
             url = "https://" + url
 
-        return super()._request(method, url, **kwargs)
+        parts = urlsplit(url)
+        return url, parts.hostname, endpoint_template(method, parts.hostname, parts.path)
+
+    async def _timed_request(self, endpoint: str, method: str, url: str, **kwargs):
+        metrics.started(endpoint)
+        started = time.perf_counter()
+        status = None
+
+        try:
+            response = await super()._request(method, url, trace_request_ctx={"endpoint": endpoint}, **kwargs)
+            status = response.status
+
+            return response
+        finally:
+            metrics.finished(endpoint, status, time.perf_counter() - started)
+
+    async def _request(self, method: str, url: str, **kwargs):
+        kwargs.update({"ssl": False})
+
+        url, host, endpoint = self._split_url(method, url)
+
+        if self.mock_url:
+            url = self.mock_url.rstrip("/") + "/" + url.split("://", 1)[1]
+
+        if self.rate_limiter is None:
+            return await self._timed_request(endpoint, method, url, **kwargs)
+
+        tries = 0
+
+        while True:
+            await self.rate_limiter.acquire(host)
+            response = await self._timed_request(endpoint, method, url, **kwargs)
+            self.rate_limiter.feedback(host, response.status, response.headers)
+
+            if response.status != 429 or tries >= self.rate_limiter.retries:
+                return response
+
+            response.release()
+            metrics.retried(endpoint)
+            tries += 1
+
+
+class SessionPool:
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+
+        self._sessions: Dict[str, ClientSession] = {}
+
+    def get(self, name: str = "default", *, rate_limiter: Optional[RateLimiter] = None) -> ClientSession:
+        session = self._sessions.get(name)
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                ssl=False
+            )
+            session = ClientSession(connector=connector, rate_limiter=rate_limiter)
+            self._sessions.update({name: session})
+
+        elif rate_limiter is not None:
+            session.rate_limiter = rate_limiter
+
+        return session
+
+    async def close(self) -> None:
+        sessions, self._sessions = list(self._sessions.values()), {}
+        await asyncio.gather(*(session.close() for session in sessions if not session.closed))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+sessions = SessionPool()
 
 
 class Auth(ClientSession):
     __slots__ = ("cookie", "user_id", "name", "username", "has_premium")
 
     def __init__(self, cookie: str) -> None:
-        super().__init__(cookies={".ROBLOSECURITY": cookie})
+        super().__init__(cookies={".ROBLOSECURITY": cookie}, rate_limiter=RateLimiter())
 
         self.cookie = cookie
 
@@ -45,11 +254,27 @@ class Auth(ClientSession):
     async def close_session(self):
         await self.close()
 
+    async def _request(self, method: str, url: str, *, csrf_retry: bool = True, **kwargs):
+        sent_token = self.headers.get("x-csrf-token")
+        response = await super()._request(method, url, **kwargs)
+
+        csrf_token = response.headers.get("x-csrf-token")
+        if not csrf_retry or response.status != 403 or csrf_token is None:
+            return response
+
+        response.release()
+        metrics.retried(self._split_url(method, url)[2])
+
+        if self.headers.get("x-csrf-token") == sent_token:
+            self.headers.update({"x-csrf-token": csrf_token})
+
+        return await super()._request(method, url, **kwargs)
+
     async def fetch_csrf_token(self, csrf_token: Optional[str] = None) -> None:
         if csrf_token is None:
             self.headers.pop("x-csrf-token", None)
 
-            async with self.post("auth.roblox.com/v1/login") as response:
+            async with self.post("auth.roblox.com/v1/login", csrf_retry=False) as response:
                 csrf_token = response.headers.get("x-csrf-token")
 
                 if csrf_token is None:
@@ -81,11 +306,6 @@ class Auth(ClientSession):
             self.has_premium = await response.json()
             return self.has_premium
 
-    async def csrf_token_updater(self, interval: int = 30) -> None:
-        while True:
-            await self.fetch_csrf_token()
-            await asyncio.sleep(interval)
-
     @classmethod
     def has_auth(cls, func: Optional[callable] = None, /, *, attr_name: str = "auth"):
         def decorator(wrapped: callable):
@@ -95,7 +315,7 @@ class Auth(ClientSession):
                 if not isinstance(attr, cls):
                     return None
 
-                await wrapped(instance, *args, **kwargs)
+                return await wrapped(instance, *args, **kwargs)
 
             def wrapper(instance, *args, **kwargs):
                 attr = getattr(instance, attr_name, None)
@@ -103,7 +323,7 @@ class Auth(ClientSession):
                 if not isinstance(attr, cls):
                     return None
 
-                wrapped(instance, *args, **kwargs)
+                return wrapped(instance, *args, **kwargs)
 
             return async_wrapper if inspect.iscoroutinefunction(wrapped) else wrapper
 
@@ -1,8 +1,11 @@
-from typing import List, Iterable, Optional
+import asyncio
+
+from typing import List, Dict, Iterable, Optional, AsyncGenerator
 
 from .utils import slice_list
 from .clients import Auth
 from .constants import FAILED_IMAGE_URL
+from .payloads import read_json, InventoryAsset, ResellersPage, ResaleData
 
 
 async def get_recent_sales(auth: Auth, *,
@@ -14,7 +17,7 @@ async def get_recent_sales(auth: Auth, *,
         if response.status != 200:
             return None
 
-        return (await response.json()).get("data")
+        return (await read_json(response)).get("data")
 
 
 async def get_users_thumbnails(user_ids: Iterable[str], auth: Auth) -> Optional[List[str]]:
@@ -26,7 +29,7 @@ async def get_users_thumbnails(user_ids: Iterable[str], auth: Auth) -> Optional[
             "thumbnails.roblox.com/v1/users/avatar-headshot?"
             f"userIds={processed_chunk}&size=50x50&format=Png&isCircular=false"
         ) as response:
-            data = (await response.json()).get("data")
+            data = (await read_json(response)).get("data")
 
             if data is None:
                 return thumbnails
@@ -40,54 +43,69 @@ async def get_users_thumbnails(user_ids: Iterable[str], auth: Auth) -> Optional[
     return thumbnails
 
 
-async def get_assets_thumbnails(asset_ids: Iterable[str], auth: Auth) -> Optional[List[str]]:
-    thumbnails = []
+async def get_assets_thumbnails(asset_ids: Iterable[str], auth: Auth) -> Dict[str, str]:
+    thumbnails = {}
 
-    for chunk in slice_list(asset_ids, 100):
+    for chunk in slice_list(list(dict.fromkeys(asset_ids)), 100):
         async with auth.get(
             "thumbnails.roblox.com/v1/assets?"
             f"assetIds={','.join(chunk)}&returnPolicy=PlaceHolder&size=50x50&format=Png&isCircular=false"
         ) as response:
-            data = (await response.json()).get("data")
+            if response.status != 200:
+                continue
 
-            if data is None:
-                return thumbnails
+            data = (await read_json(response)).get("data")
 
-            thumbnails_with_ids = {str(img["targetId"]): img["imageUrl"] if img["state"] == "Completed" else FAILED_IMAGE_URL for img in data}
+            if data is None:
+                continue
 
-            for item_id in asset_ids:
-                if item_id in thumbnails_with_ids:
-                    thumbnails.append(thumbnails_with_ids[item_id])
+            thumbnails.update({str(img["targetId"]): img["imageUrl"] if img["state"] == "Completed" else FAILED_IMAGE_URL for img in data})
 
     return thumbnails
 
 
-async def get_items_details(item_ids: List[int], auth: Auth) -> List[dict]:
-    items = []
+async def get_items_details(item_ids: Iterable[str], auth: Auth) -> Dict[str, dict]:
+    items = {}
 
-    for chunk in slice_list(item_ids, 120):
+    for chunk in slice_list(list(dict.fromkeys(item_ids)), 120):
         payload = {"items": [{"itemType": 1, "id": str(_id)} for _id in chunk]}
 
         async with auth.post(
             "catalog.roblox.com/v1/catalog/items/details",
             json=payload
         ) as response:
-            data = (await response.json()).get("data")
+            if response.status != 200:
+                continue
 
-            if data is None:
-                return items
+            data = (await read_json(response)).get("data")
 
-            items_with_ids = {str(details["id"]): details for details in data}
+            if data is None:
+                continue
 
-            for item_id in item_ids:
-                if item_id in items_with_ids:
-                    items.append(items_with_ids[item_id])
+            items.update({str(details["id"]): details for details in data})
 
     return items
 
 
-async def get_user_inventory(item_type: int, auth: Auth) -> List[dict]:
-    assets = []
+async def get_items_market_details(collectible_item_ids: Iterable[str], auth: Auth) -> Dict[str, dict]:
+    async def load_chunk(chunk: List[str]) -> List[dict]:
+        async with auth.post(
+            "apis.roblox.com/marketplace-items/v1/items/details",
+            json={"itemIds": chunk}
+        ) as response:
+            if response.status != 200:
+                return []
+
+            data = await read_json(response)
+            return data if isinstance(data, list) else []
+
+    chunks = slice_list(list(dict.fromkeys(collectible_item_ids)), 30)
+    items = await asyncio.gather(*(load_chunk(chunk) for chunk in chunks))
+
+    return {details["collectibleItemId"]: details for chunk in items for details in chunk}
+
+
+async def iter_user_inventory(item_type: int, auth: Auth) -> AsyncGenerator[List[InventoryAsset], None]:
     cursor = ""
 
     while True:
@@ -96,19 +114,52 @@ async def get_user_inventory(item_type: int, auth: Auth) -> List[dict]:
             f"limit=100&cursor={cursor}&sortOrder=Desc"
         ) as response:
             if response.status != 200:
-                return assets
-            data = await response.json()
+                return
+            data = await read_json(response)
+
+        cursor = data.get("nextPageCursor")
+        page = [InventoryAsset.from_json(asset) for asset in data.get("data") or () if asset.get("serialNumber")]
 
-            cursor = data.get("nextPageCursor")
-            assets.extend(
-                    [asset for asset in data.get("data") if asset.get("serialNumber")])
+        if page:
+            yield page
+
+        if not cursor:
+            return
+
+
+async def get_user_inventory(item_type: int, auth: Auth) -> List[InventoryAsset]:
+    return [asset async for page in iter_user_inventory(item_type, auth) for asset in page]
+
+
+async def get_resale_data(collectible_item_id: str, auth: Auth) -> Optional[ResaleData]:
+    async with auth.get(
+        f"apis.roblox.com/marketplace-sales/v1/item/{collectible_item_id}/resale-data"
+    ) as response:
+        if response.status != 200:
+            return None
+
+        return ResaleData.from_json(await read_json(response))
+
+
+async def get_item_resellers(collectible_item_id: str, auth: Auth, *,
+                             limit: Optional[int] = 99, cursor: Optional[str] = "") -> Optional[ResellersPage]:
+    async with auth.get(
+        f"apis.roblox.com/marketplace-sales/v1/item/{collectible_item_id}/resellers?"
+        f"limit={limit}&cursor={cursor}"
+    ) as response:
+        if response.status != 200:
+            return None
+
+        try:
+            data = await read_json(response)
+        except Exception:
+            return None
 
-            if not cursor:
-                return assets
+        return ResellersPage.from_json(data) if data.get("data") is not None else None
 
 
 async def get_current_cap(auth: Auth) -> Optional[dict]:
     async with auth.get(
         "itemconfiguration.roblox.com/v1/collectibles/metadata"
     ) as response:
-        return (await response.json()).get("limitedItemPriceFloors")
+        return (await read_json(response)).get("limitedItemPriceFloors")
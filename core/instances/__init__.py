@@ -1,2 +1,6 @@
-from .item import Item
+from .item import Item, CollectibleChanges
+from .item_registry import ItemRegistry
 from .collectible import Collectible
+from .collectible_store import CollectibleStore, CollectibleView
+from .order_book import OrderBook
+from .sales import SalesHistory
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from .item import Item
 
 from ..clients import Auth
+from ..journal import SellJournal
 
 __all__ = ("Collectible",)
 
@@ -58,12 +59,17 @@ class Collectible:
         self.product_id = product_id
         self.instance_id = instance_id
 
-        self.skip_on_sale = skip_on_sale
+        if skip_on_sale is not None:
+            self.skip_on_sale = skip_on_sale
 
-    async def sell(self, price: int, auth: Auth) -> Optional[aiohttp.ClientResponse]:
+    async def sell(self, price: int, auth: Auth,
+                   journal: Optional[SellJournal] = None) -> Optional[aiohttp.ClientResponse]:
         if None in (self.item_id, self.instance_id, self.product_id) or self.skip_on_sale:
             return None
 
+        if journal is not None:
+            journal.record(self.item_id, self.instance_id, price, SellJournal.INTENDED)
+
         payload = {
             "collectibleProductId": self.product_id,
             "isOnSale": True,
@@ -78,6 +84,11 @@ class Collectible:
         ) as response:
             if response.status == 200:
                 self.on_sale = True
+                self.sale_price = price
+
+            if journal is not None:
+                status = SellJournal.CONFIRMED if response.status == 200 else SellJournal.FAILED
+                journal.record(self.item_id, self.instance_id, price, status)
 
             return response
 
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+from array import array
+import sys
+
+from typing import Optional, List, Dict, Iterator, Sequence, Iterable, Any, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .item import Item
+
+from .collectible import Collectible
+
+__all__ = ("CollectibleStore", "CollectibleView")
+
+_NONE = -1
+_COLUMNS = ("on_sale_states", "sale_prices", "skip_states", "item_ids", "instance_ids", "product_ids")
+
+
+def _to_state(value: Optional[bool]) -> int:
+    return _NONE if value is None else int(value)
+
+
+def _from_state(value: int) -> Optional[bool]:
+    return None if value == _NONE else bool(value)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _IdColumn:
+    __slots__ = ("_data", "_other")
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self._other: Dict[int, Optional[str]] = {}
+
+    @staticmethod
+    def _encode(value: Optional[str]) -> Optional[bytes]:
+        if (
+            not isinstance(value, str)
+            or len(value) != 36
+            or value[8] != "-" or value[13] != "-" or value[18] != "-" or value[23] != "-"
+            or value != value.lower()
+        ):
+            return None
+
+        try:
+            return bytes.fromhex(value.replace("-", ""))
+        except ValueError:
+            return None
+
+    def __getitem__(self, position: int) -> Optional[str]:
+        if position in self._other:
+            return self._other[position]
+
+        value = self._data[position * 16:position * 16 + 16].hex()
+        return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+    def __setitem__(self, position: int, value: Optional[str]) -> None:
+        encoded = self._encode(value)
+
+        if encoded is None:
+            self._other.update({position: value})
+        else:
+            self._other.pop(position, None)
+            self._data[position * 16:position * 16 + 16] = encoded
+
+    def append(self, value: Optional[str]) -> None:
+        self._data.extend(bytes(16))
+        self[len(self) - 1] = value
+
+    def extend(self, values: Iterable[Optional[str]]) -> None:
+        encoded = bytearray()
+
+        for position, value in enumerate(values, len(self)):
+            raw = self._encode(value)
+
+            if raw is None:
+                self._other.update({position: value})
+                raw = bytes(16)
+
+            encoded += raw
+
+        self._data += encoded
+
+    def pop(self) -> Optional[str]:
+        value = self[len(self) - 1]
+
+        self._other.pop(len(self) - 1, None)
+        del self._data[-16:]
+
+        return value
+
+    def __len__(self) -> int:
+        return len(self._data) // 16
+
+
+class CollectibleView(Collectible):
+    __slots__ = ("_store", "_view_serial")
+
+    def __init__(self, store: CollectibleStore, serial: int) -> None:
+        self._store = store
+        self._view_serial = serial
+
+    def _get(self, column: str) -> Any:
+        return self._store.read(self._view_serial, column)
+
+    def _set(self, column: str, value: Any) -> None:
+        self._store.write(self._view_serial, column, value)
+
+    @property
+    def serial(self) -> int:
+        return self._view_serial
+
+    @property
+    def on_sale(self) -> Optional[bool]:
+        return _from_state(self._get("on_sale_states"))
+
+    @on_sale.setter
+    def on_sale(self, value: Optional[bool]) -> None:
+        self._set("on_sale_states", _to_state(value))
+
+    @property
+    def sale_price(self) -> Optional[int]:
+        price = self._get("sale_prices")
+        return None if price == _NONE else price
+
+    @sale_price.setter
+    def sale_price(self, value: Optional[int]) -> None:
+        self._set("sale_prices", _NONE if value is None else value)
+
+    @property
+    def skip_on_sale(self) -> Optional[bool]:
+        return _from_state(self._get("skip_states"))
+
+    @skip_on_sale.setter
+    def skip_on_sale(self, value: Optional[bool]) -> None:
+        self._set("skip_states", _to_state(value))
+
+    @property
+    def item_id(self) -> Optional[str]:
+        return self._get("item_ids")
+
+    @item_id.setter
+    def item_id(self, value: Optional[str]) -> None:
+        self._set("item_ids", _intern(value))
+
+    @property
+    def instance_id(self) -> Optional[str]:
+        return self._get("instance_ids")
+
+    @instance_id.setter
+    def instance_id(self, value: Optional[str]) -> None:
+        self._set("instance_ids", value)
+
+    @property
+    def product_id(self) -> Optional[str]:
+        return self._get("product_ids")
+
+    @product_id.setter
+    def product_id(self, value: Optional[str]) -> None:
+        self._set("product_ids", value)
+
+    @property
+    def item(self) -> Optional[Item]:
+        return self._store.item
+
+    @item.setter
+    def item(self, value: Optional[Item]) -> None:
+        self._store.item = value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CollectibleView):
+            return self._store is other._store and self._view_serial == other._view_serial
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._view_serial))
+
+
+class CollectibleStore:
+    __slots__ = ("item", "serials", "on_sale_states", "sale_prices", "skip_states",
+                 "item_ids", "instance_ids", "product_ids", "_positions", "_detached")
+
+    def __init__(self, item: Optional[Item] = None) -> None:
+        self.item = item
+
+        self.serials = array("q")
+        self.on_sale_states = array("b")
+        self.sale_prices = array("q")
+        self.skip_states = array("b")
+
+        self.item_ids: List[Optional[str]] = []
+        self.instance_ids = _IdColumn()
+        self.product_ids = _IdColumn()
+
+        self._positions: Dict[int, int] = {}
+        self._detached: Dict[int, Dict[str, Any]] = {}
+
+    def position(self, serial: int) -> int:
+        return self._positions[serial]
+
+    def read(self, serial: int, column: str) -> Any:
+        position = self._positions.get(serial)
+
+        if position is None:
+            return self._detached[serial][column]
+
+        return getattr(self, column)[position]
+
+    def write(self, serial: int, column: str, value: Any) -> None:
+        position = self._positions.get(serial)
+
+        if position is None:
+            self._detached[serial][column] = value
+        else:
+            getattr(self, column)[position] = value
+
+    def add(
+        self,
+        serial: int,
+        on_sale: Optional[bool] = None,
+        sale_price: Optional[int] = None,
+        item_id: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        skip_on_sale: Optional[bool] = None
+    ) -> CollectibleView:
+        if serial in self._positions:
+            view = CollectibleView(self, serial)
+            view.set_values(on_sale=on_sale, sale_price=sale_price, item_id=item_id,
+                            instance_id=instance_id, product_id=product_id, skip_on_sale=skip_on_sale)
+            return view
+
+        self._positions.update({serial: len(self.serials)})
+        self._detached.pop(serial, None)
+
+        self.serials.append(serial)
+        self.on_sale_states.append(_to_state(on_sale))
+        self.sale_prices.append(_NONE if sale_price is None else sale_price)
+        self.skip_states.append(_to_state(skip_on_sale))
+
+        self.item_ids.append(_intern(item_id))
+        self.instance_ids.append(instance_id)
+        self.product_ids.append(product_id)
+
+        return CollectibleView(self, serial)
+
+    def extend(
+        self,
+        serials: Sequence[int],
+        on_sale: Sequence[Optional[bool]],
+        sale_prices: Sequence[Optional[int]],
+        item_ids: Sequence[Optional[str]],
+        instance_ids: Sequence[Optional[str]],
+        product_ids: Sequence[Optional[str]]
+    ) -> None:
+        if any(serial in self._positions for serial in serials):
+            raise ValueError("Serials passed to extend must not be in the store yet")
+
+        start = len(self.serials)
+        self._positions.update(zip(serials, range(start, start + len(serials))))
+
+        for serial in serials:
+            self._detached.pop(serial, None)
+
+        self.serials.extend(serials)
+        self.on_sale_states.extend(map(_to_state, on_sale))
+        self.sale_prices.extend(_NONE if price is None else price for price in sale_prices)
+        self.skip_states.extend([_NONE] * len(serials))
+
+        self.item_ids.extend(map(_intern, item_ids))
+        self.instance_ids.extend(instance_ids)
+        self.product_ids.extend(product_ids)
+
+    def update(
+        self,
+        serials: Sequence[int],
+        on_sale: Sequence[Optional[bool]],
+        sale_prices: Sequence[Optional[int]],
+        item_ids: Sequence[Optional[str]],
+        instance_ids: Sequence[Optional[str]],
+        product_ids: Sequence[Optional[str]]
+    ) -> None:
+        positions = [self._positions[serial] for serial in serials]
+
+        for column, values in (
+            (self.on_sale_states, map(_to_state, on_sale)),
+            (self.sale_prices, (_NONE if price is None else price for price in sale_prices)),
+            (self.item_ids, map(_intern, item_ids)),
+            (self.instance_ids, instance_ids),
+            (self.product_ids, product_ids)
+        ):
+            for position, value in zip(positions, values):
+                column[position] = value
+
+    def get(self, serial: int, default: Optional[Any] = None) -> Union[CollectibleView, Any]:
+        if serial not in self._positions:
+            return default
+
+        return CollectibleView(self, serial)
+
+    def pop(self, serial: int) -> Collectible:
+        position = self._positions.pop(serial)
+        last = len(self.serials) - 1
+
+        row = {column: getattr(self, column)[position] for column in _COLUMNS}
+        self._detached.update({serial: row})
+
+        removed = Collectible(
+            serial=serial,
+            on_sale=_from_state(row["on_sale_states"]),
+            sale_price=None if row["sale_prices"] == _NONE else row["sale_prices"],
+            item_id=row["item_ids"],
+            instance_id=row["instance_ids"],
+            product_id=row["product_ids"],
+            item=self.item,
+            skip_on_sale=_from_state(row["skip_states"])
+        )
+
+        for column in (self.serials, self.on_sale_states, self.sale_prices, self.skip_states,
+                       self.item_ids, self.instance_ids, self.product_ids):
+            column[position] = column[last]
+            column.pop()
+
+        if position != last:
+            self._positions.update({self.serials[position]: position})
+
+        return removed
+
+    def values(self) -> Iterator[CollectibleView]:
+        return (CollectibleView(self, serial) for serial in self.serials)
+
+    def __contains__(self, serial: int) -> bool:
+        return serial in self._positions
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self.serials))
+
+    def __len__(self) -> int:
+        return len(self.serials)
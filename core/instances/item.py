@@ -1,44 +1,70 @@
 import asyncio
-from datetime import datetime
 
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Dict, Any, Union
 
+from ..cache import TTLCache
 from ..clients import Auth
+from ..detection import get_resale_data, get_item_resellers
+from ..journal import SellJournal
+from ..payloads import read_json, InventoryAsset, CatalogDetails, ResellableInstance
 from ..utils import IgnoreNew
 from ..visuals import Display
 from .collectible import Collectible
+from .collectible_store import CollectibleStore
+from .order_book import OrderBook
+from .sales import SalesHistory
 
-__all__ = ("Item",)
+__all__ = ("Item", "CollectibleChanges")
+
+
+class CollectibleChanges:
+    __slots__ = ("added", "updated", "removed")
+
+    def __init__(self,
+                 added: Optional[List[Collectible]] = None,
+                 updated: Optional[List[Collectible]] = None,
+                 removed: Optional[List[Collectible]] = None) -> None:
+        self.added = added or []
+        self.updated = updated or []
+        self.removed = removed or []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
 
 
 class Item:
     __slots__ = ("_id", "item_id", "_link", "name", "thumbnail",
-                 "price", "quantity", "lowest_resale_price",
+                 "asset_type", "price", "quantity", "lowest_resale_price",
                  "_creator_id", "creator_name", "_creator_link",
                  "recent_average_price", "has_resales", "latest_sale",
-                 "has_sales", "price_to_sell", "auth", "_collectibles",
-                 "resales", "sales")
+                 "has_sales", "price_to_sell", "manual_price", "auth", "journal",
+                 "_collectibles", "resales", "sales")
+
+    market_cache = TTLCache(ttl=30)
 
     def __init__(
         self,
-        item_info: dict,
-        item_details: dict,
+        item_info: InventoryAsset,
+        item_details: CatalogDetails,
         *,
         thumbnail: Optional[str] = None,
         price_to_sell: Optional[int] = None,
-        auth: Optional[Auth] = None
+        auth: Optional[Auth] = None,
+        journal: Optional[SellJournal] = None,
+        compact: bool = False
     ) -> None:
-        self._id = item_info["assetId"]
-        self.item_id = item_info["collectibleItemId"]
+        self._id = item_info.asset_id
+        self.item_id = item_info.collectible_item_id
         self._link = f"https://www.roblox.com/catalog/{self._id}"
-        self.name = item_info["assetName"]
+        self.name = item_info.name
         self.thumbnail = thumbnail
-        self.price = item_details.get("price")
-        self.quantity = item_details.get("totalQuantity")
-        self.lowest_resale_price = item_details["lowestResalePrice"]
+        self.asset_type = item_details.asset_type
+        self.price = item_details.price
+        self.quantity = item_details.total_quantity
+        self.lowest_resale_price = item_details.lowest_resale_price
 
-        self._creator_id = item_details.get("creatorTargetId")
-        self.creator_name = item_details.get("creatorName")
+        self._creator_id = item_details.creator_id
+        self.creator_name = item_details.creator_name
         self._creator_link = f"https://www.roblox.com/groups/{self._creator_id}"
 
         self.recent_average_price = None
@@ -47,11 +73,13 @@ class Item:
         self.has_sales = None
 
         self.price_to_sell = price_to_sell
+        self.manual_price = False
         self.auth = auth
+        self.journal = journal
 
-        self._collectibles = {}
-        self.resales = []
-        self.sales = []
+        self._collectibles = CollectibleStore(self) if compact else {}
+        self.resales = OrderBook()
+        self.sales = SalesHistory()
 
     id = IgnoreNew()
     link = IgnoreNew()
@@ -69,6 +97,9 @@ class Item:
     def remove_collectible(self, serial: int) -> None:
         return self._collectibles.pop(serial)
 
+    def is_resumed(self, collectible: Collectible) -> bool:
+        return self.journal is not None and self.journal.is_resumed(collectible.instance_id)
+
     @staticmethod
     def __define_status(value: str, state: str, name: str):
         def decorator(_):
@@ -108,8 +139,8 @@ class Item:
     ) -> None:
         col = self.get_collectible(serial)
 
-        if not col and serial is not None:
-            new = Collectible(
+        if not col and serial is not None and isinstance(self._collectibles, CollectibleStore):
+            self._collectibles.add(
                 serial=serial,
                 on_sale=on_sale,
                 sale_price=sale_price,
@@ -117,6 +148,16 @@ class Item:
                 instance_id=instance_id,
                 product_id=product_id
             )
+        elif not col and serial is not None:
+            new = Collectible(
+                serial=serial,
+                on_sale=on_sale,
+                sale_price=sale_price,
+                item_id=(item_id or self.item_id),
+                instance_id=instance_id,
+                product_id=product_id,
+                item=self
+            )
             self._collectibles.update({serial: new})
         elif col:
             col.set_values(
@@ -134,19 +175,30 @@ class Item:
         skip_on_sale: bool = False,
         skip_if_cheapest: bool = False,
         verbose: bool = True,
-        retries: int = 1
+        retries: int = 1,
+        concurrency: int = 1,
+        skip_confirmed: bool = False
     ) -> Optional[int]:
-        await self.fetch_collectibles()
+        changes = await self.fetch_collectibles()
+
+        if changes is not None and verbose:
+            for col in changes.removed:
+                Display.skipping(f"This collectible is no longer in your inventory [g(#{col.serial})]")
 
-        sold_amount = 0
         price_to_sell = (price or self.price_to_sell)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
 
-        for col in self.collectibles:
-            tries = 0
+        to_sell = []
 
+        for col in self.collectibles:
             if col.skip_on_sale:
                 continue
 
+            elif skip_confirmed and self.is_resumed(col):
+                if verbose:
+                    Display.skipping(f"This collectible was already put on sale before [g(#{col.serial})]")
+                continue
+
             elif col.sale_price == price_to_sell:
                 if verbose:
                     Display.skipping(f"This collectible is already on sale for the same price [g(#{col.serial})]")
@@ -163,143 +215,213 @@ class Item:
                         Display.skipping(f"You are already selling this collectible for the cheapest price [g(#{col.serial})]")
                     continue
 
-            while True:
-                response = await col.sell(price_to_sell, self.auth)
-
-                match response.status:
-                    case 200:
-                        if verbose:
-                            Display.success(f"Successfully sold for $[g{price_to_sell} (#{col.serial})]")
-
-                        sold_amount += 1
-                        break
-                    case 429:
-                        if verbose:
-                            Display.error("You got rate limited! Trying again in 30 seconds...")
-                        tries += 1
-                        await asyncio.sleep(30)
-                    case 403:
-                        if response.reason == "Forbidden":
-                            break
-                        tries += 1
-                    case None:
-                        break
-                    case _:
-                        if verbose:
-                            Display.error(f"Failed to sell limited ({response.status}): {response.reason}")
+            to_sell.append(col)
+
+        async def limited_sell(col: Collectible) -> bool:
+            async with semaphore:
+                return await self._sell_collectible(col, price_to_sell, verbose=verbose, retries=retries)
+
+        sold = await asyncio.gather(*(limited_sell(col) for col in to_sell))
+
+        if any(sold):
+            self.invalidate_resales()
+
+        return sum(sold)
+
+    async def _sell_collectible(self, col: Collectible, price: int, *,
+                                verbose: bool = True, retries: int = 1) -> bool:
+        tries = 0
+
+        while True:
+            response = await col.sell(price, self.auth, self.journal)
 
-                        tries += 1
-                        await asyncio.sleep(3)
+            match getattr(response, "status", None):
+                case 200:
+                    if verbose:
+                        Display.success(f"Successfully sold for $[g{price} (#{col.serial})]")
+
+                    return True
+                case 429:
+                    if verbose:
+                        Display.error("You got rate limited! Trying again...")
+                    tries += 1
+                case 403:
+                    if response.reason == "Forbidden":
+                        return False
+                    tries += 1
+                case None:
+                    return False
+                case _:
+                    if verbose:
+                        Display.error(f"Failed to sell limited ({response.status}): {response.reason}")
+
+                    tries += 1
+                    await asyncio.sleep(3)
+
+            if tries > retries:
+                return False
+
+    def update_market_details(self, details: dict) -> None:
+        self.price = details.get("price", self.price)
+        self.quantity = details.get("totalQuantity", self.quantity)
 
-                if tries > retries:
-                    break
+        lowest_price = details.get("lowestResalePrice", details.get("lowestPrice"))
 
-        return sold_amount
+        if details.get("hasResellers", True) and lowest_price:
+            self.lowest_resale_price = lowest_price
+            self.has_resales = True
+        else:
+            self.has_resales = False
 
     @Auth.has_auth
     async def fetch_sales(self, *,
                           save_sales: Optional[bool] = True,
                           save_rap: Optional[bool] = True,
                           save_latest_sale: Optional[bool] = True) -> None:
-        async with self.auth.get(
-            f"apis.roblox.com/marketplace-sales/v1/item/{self.item_id}/resale-data"
-        ) as response:
-            if response.status != 200:
-                return None
-
-            data = await response.json()
-
-            if save_sales:
-                for price, amount in zip(data["priceDataPoints"], data["volumeDataPoints"]):
-                    data = {
-                        "price": price["value"],
-                        "amount": amount["value"],
-                        "date": datetime.strptime(price["date"], "%Y-%m-%dT%H:%M:%SZ")
-                    }
-                    self.sales.append(data)
-
-            if save_rap:
-                self.recent_average_price = round(data.get("recentAveragePrice", 0))
-
-            if save_latest_sale:
-                if data["priceDataPoints"] and data["priceDataPoints"][0]["value"]:
-                    self.latest_sale = data["priceDataPoints"][0]["value"]
-                    self.has_sales = True
-                else:
-                    self.has_sales = False
+        data = await self.market_cache.get_or_fetch(
+            ("resale-data", self.item_id),
+            lambda: get_resale_data(self.item_id, self.auth)
+        )
+
+        if data is None:
+            return None
+
+        if save_sales:
+            self.sales.update_from_resale_data(data)
+
+        if save_rap:
+            self.recent_average_price = round(data.recent_average_price)
+
+        if save_latest_sale:
+            if data.latest_price:
+                self.latest_sale = data.latest_price
+                self.has_sales = True
+            else:
+                self.has_sales = False
 
     @Auth.has_auth
     async def fetch_resales(self, *,
                             save_resales: Optional[bool] = True,
-                            save_lrp: Optional[bool] = True) -> None:
-        async with self.auth.get(
-            f"apis.roblox.com/marketplace-sales/v1/item/{self.item_id}/resellers?"
-            f"limit=99"
-        ) as response:
-            try:
-                data = (await response.json()).get("data")
-            except:
-                return None
-
-            if data is None:
-                return None
-
-            if save_resales:
-                for resale in data:
-                    seller = resale["seller"]
-
-                    data = {
-                        "lowest_resale_price": resale["price"],
-                        "serial": resale["serialNumber"],
-                        "seller_id": seller["sellerId"],
-                        "seller_name": seller["name"]
-                    }
-                    self.resales.append(data)
-
-            if save_lrp:
-                if data:
-                    self.lowest_resale_price = data[0]["price"]
-                    self.has_resales = True
-                else:
-                    self.has_resales = False
-
-    @Auth.has_auth
-    async def fetch_collectibles(self) -> None:
+                            save_lrp: Optional[bool] = True,
+                            depth: Optional[int] = 99,
+                            below: Optional[int] = None) -> None:
+        book = OrderBook(depth if save_resales else 1)
         cursor = ""
 
         while True:
-            async with self.auth.get(
-                f"apis.roblox.com/marketplace-sales/v1/item/{self.item_id}/resellable-instances?"
-                f"cursor={cursor}&ownerType=User&ownerId={self.auth.user_id}&limit=9999999"
-            ) as response:
-                if response.status != 200:
+            page = await self.market_cache.get_or_fetch(
+                ("resellers", self.item_id, cursor),
+                lambda: get_item_resellers(self.item_id, self.auth, cursor=cursor)
+            )
+
+            if page is None:
+                if not book.cursors:
                     return None
+                break
+
+            book.cursors.append(cursor)
+            book.add_resellers(page.resales)
 
-                data = await response.json()
+            cursor = page.next_cursor
+            if not cursor:
+                book.complete = True
+                break
 
-                serials_list = []
+            if book.is_deep_enough(below):
+                break
 
-                for instance in data.get("itemInstances"):
-                    col_serial = instance["serialNumber"]
+        if save_resales:
+            self.resales = book
 
-                    self.add_collectible(
-                        serial=col_serial,
-                        on_sale=(True if instance["saleState"] == "OnSale" else False),
-                        sale_price=instance.get("price"),
-                        item_id=instance["collectibleItemId"],
-                        instance_id=instance["collectibleInstanceId"],
-                        product_id=instance["collectibleProductId"]
-                    )
-                    serials_list.append(col_serial)
+        if save_lrp:
+            if book:
+                self.lowest_resale_price = book.lowest
+                self.has_resales = True
+            else:
+                self.has_resales = False
 
-                for serial in list(self._collectibles):
-                    if serial not in serials_list:
-                        self.remove_collectible(serial)
+    def invalidate_resales(self) -> None:
+        for cursor in {"", *self.resales.cursors}:
+            self.market_cache.invalidate(("resellers", self.item_id, cursor))
 
-                cursor = data.get("nextPageCursor")
+    @Auth.has_auth
+    async def fetch_collectibles(self, *, limit: Optional[int] = 100) -> Optional[CollectibleChanges]:
+        instances = {}
+        cursor = ""
+        seen_cursors = set()
 
-                if cursor == data.get("previousPageCursor"):
+        while True:
+            async with self.auth.get(
+                f"apis.roblox.com/marketplace-sales/v1/item/{self.item_id}/resellable-instances?"
+                f"cursor={cursor}&ownerType=User&ownerId={self.auth.user_id}&limit={limit}"
+            ) as response:
+                if response.status != 200:
                     return None
 
+                data = await read_json(response)
+
+            for instance in data.get("itemInstances") or ():
+                instances.update({instance["serialNumber"]: ResellableInstance.from_json(instance)})
+
+            seen_cursors.add(cursor)
+            cursor = data.get("nextPageCursor")
+
+            if not cursor or cursor in seen_cursors:
+                break
+
+        return self.reconcile_collectibles(instances)
+
+    def reconcile_collectibles(self, instances: Dict[int, ResellableInstance]) -> CollectibleChanges:
+        current = set(self._collectibles)
+        fetched = set(instances)
+
+        changes = CollectibleChanges(
+            removed=[self.remove_collectible(serial) for serial in current - fetched]
+        )
+
+        added, updated = [], []
+
+        for serial, instance in instances.items():
+            col = self.get_collectible(serial)
+
+            if col is None:
+                added.append(instance)
+            elif (
+                col.on_sale != instance.on_sale
+                or col.sale_price != instance.price
+                or col.instance_id != instance.instance_id
+                or col.product_id != instance.product_id
+            ):
+                updated.append(instance)
+
+        if isinstance(self._collectibles, CollectibleStore):
+            self._collectibles.extend(*self._instance_columns(added))
+            self._collectibles.update(*self._instance_columns(updated))
+        else:
+            for instance in (*added, *updated):
+                self.add_collectible(
+                    serial=instance.serial,
+                    on_sale=instance.on_sale,
+                    sale_price=instance.price,
+                    item_id=instance.item_id,
+                    instance_id=instance.instance_id,
+                    product_id=instance.product_id
+                )
+
+        changes.added = [self.get_collectible(instance.serial) for instance in added]
+        changes.updated = [self.get_collectible(instance.serial) for instance in updated]
+
+        return changes
+
+    def _instance_columns(self, instances: List[ResellableInstance]) -> tuple[list, ...]:
+        return (
+            [instance.serial for instance in instances],
+            [instance.on_sale for instance in instances],
+            [instance.price for instance in instances],
+            [instance.item_id or self.item_id for instance in instances],
+            [instance.instance_id for instance in instances],
+            [instance.product_id for instance in instances]
+        )
+
     def __len__(self) -> int:
-        return len(self.collectibles)
+        return len(self._collectibles)
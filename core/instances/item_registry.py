@@ -0,0 +1,125 @@
+from typing import Optional, List, Dict, Iterator, Callable, Any, Union
+
+from .item import Item
+
+__all__ = ("ItemRegistry",)
+
+
+class ItemRegistry:
+    __slots__ = ("_items", "_order", "_positions", "_cursor", "_dead", "_dead_before")
+
+    def __init__(self) -> None:
+        self._items: Dict[int, Item] = {}
+        self._order: List[Optional[int]] = []
+        self._positions: Dict[int, int] = {}
+
+        self._cursor = 0
+        self._dead = 0
+        self._dead_before = 0
+
+    @property
+    def current(self) -> Optional[Item]:
+        self._skip_removed()
+
+        if self._cursor >= len(self._order):
+            return None
+
+        return self._items[self._order[self._cursor]]
+
+    @property
+    def index(self) -> int:
+        self._skip_removed()
+        return self._cursor - self._dead_before
+
+    def get(self, _id: int, default: Optional[Any] = None) -> Union[Item, Any]:
+        return self._items.get(_id, default)
+
+    def add(self, item: Item) -> Item:
+        if item.id not in self._items:
+            self._positions.update({item.id: len(self._order)})
+            self._order.append(item.id)
+
+        self._items.update({item.id: item})
+        return item
+
+    def remove(self, _id: int) -> Item:
+        item = self._items.pop(_id)
+        position = self._positions.pop(_id)
+
+        self._order[position] = None
+        self._dead += 1
+
+        if position < self._cursor:
+            self._dead_before += 1
+
+        return item
+
+    def advance(self) -> bool:
+        self._skip_removed()
+        self._cursor += 1
+        self._skip_removed()
+
+        if self._cursor < len(self._order):
+            if self._dead > len(self._order) // 2:
+                self._compact()
+
+            return True
+
+        self.reset()
+        return False
+
+    def reset(self) -> None:
+        self._compact()
+        self._cursor = 0
+
+    def upcoming(self, count: int) -> List[Item]:
+        self._skip_removed()
+        upcoming = []
+
+        for position in range(self._cursor, len(self._order)):
+            if len(upcoming) >= count:
+                break
+
+            if self._order[position] is not None:
+                upcoming.append(self._items[self._order[position]])
+
+        return upcoming
+
+    def sort(self, key: Callable[[Item], Any]) -> None:
+        current = self.current
+
+        self._order = sorted(self._items, key=lambda _id: key(self._items[_id]))
+        self._positions = {_id: position for position, _id in enumerate(self._order)}
+        self._dead = self._dead_before = 0
+
+        self._cursor = self._positions[current.id] if current is not None else len(self._order)
+
+    def _skip_removed(self) -> None:
+        while self._cursor < len(self._order) and self._order[self._cursor] is None:
+            self._cursor += 1
+            self._dead_before += 1
+
+    def _compact(self) -> None:
+        if not self._dead:
+            return None
+
+        self._cursor -= self._dead_before
+        self._order = [_id for _id in self._order if _id is not None]
+        self._positions = {_id: position for position, _id in enumerate(self._order)}
+        self._dead = self._dead_before = 0
+
+    def __contains__(self, _id: int) -> bool:
+        return _id in self._items
+
+    def __iter__(self) -> Iterator[Item]:
+        for _id in self._order:
+            item = self._items.get(_id)
+
+            if item is not None:
+                yield item
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
@@ -0,0 +1,101 @@
+from bisect import bisect_left, bisect_right
+
+from typing import Optional, Iterable, Iterator, List, Dict
+
+from ..payloads import Resale
+
+__all__ = ("OrderBook",)
+
+
+class OrderBook:
+    __slots__ = ("depth", "cursors", "complete", "_prices", "_listings", "_serials")
+
+    def __init__(self, depth: Optional[int] = 99) -> None:
+        self.depth = depth
+        self.cursors: List[str] = []
+        self.complete = False
+
+        self._prices: List[int] = []
+        self._listings: List[dict] = []
+        self._serials: Dict[int, dict] = {}
+
+    @property
+    def lowest(self) -> Optional[int]:
+        return self._prices[0] if self._prices else None
+
+    @property
+    def highest(self) -> Optional[int]:
+        return self._prices[-1] if self._prices else None
+
+    def is_deep_enough(self, below: Optional[int] = None) -> bool:
+        if self.depth is not None and len(self._prices) >= self.depth:
+            return True
+
+        return below is not None and bool(self._prices) and self._prices[-1] >= below
+
+    def add(self, price: int, serial: int, seller_id: Optional[int] = None,
+            seller_name: Optional[str] = None) -> None:
+        listing = self._serials.get(serial)
+
+        if listing is not None:
+            if listing["price"] == price:
+                return None
+
+            self.remove(serial)
+
+        listing = {
+            "price": price,
+            "serial": serial,
+            "seller_id": seller_id,
+            "seller_name": seller_name
+        }
+
+        index = bisect_right(self._prices, price)
+        self._prices.insert(index, price)
+        self._listings.insert(index, listing)
+        self._serials.update({serial: listing})
+
+    def add_resellers(self, resellers: Iterable[Resale]) -> None:
+        for resale in resellers:
+            self.add(resale.price, resale.serial, resale.seller_id, resale.seller_name)
+
+    def remove(self, serial: int) -> Optional[dict]:
+        listing = self._serials.pop(serial, None)
+        if listing is None:
+            return None
+
+        index = bisect_left(self._prices, listing["price"])
+
+        while self._listings[index] is not listing:
+            index += 1
+
+        del self._prices[index]
+        del self._listings[index]
+
+        return listing
+
+    def count_below(self, price: int) -> int:
+        return bisect_left(self._prices, price)
+
+    def rank_for(self, price: int) -> int:
+        return self.count_below(price) + 1
+
+    def clear(self) -> None:
+        self.cursors.clear()
+        self.complete = False
+
+        self._prices.clear()
+        self._listings.clear()
+        self._serials.clear()
+
+    def __contains__(self, serial: int) -> bool:
+        return serial in self._serials
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._listings)
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def __bool__(self) -> bool:
+        return bool(self._listings)
@@ -0,0 +1,118 @@
+from bisect import bisect_left
+from array import array
+import math
+
+from typing import Optional, Iterable, Tuple
+
+from ..payloads import ResaleData
+
+__all__ = ("SalesHistory",)
+
+DAY = 24 * 60 * 60
+
+
+class SalesHistory:
+    __slots__ = ("window", "_dates", "_prices", "_volumes")
+
+    def __init__(self, window: Optional[int] = 180 * DAY) -> None:
+        self.window = window
+
+        self._dates = array("q")
+        self._prices = array("q")
+        self._volumes = array("q")
+
+    @property
+    def dates(self) -> array:
+        return self._dates
+
+    @property
+    def prices(self) -> array:
+        return self._prices
+
+    @property
+    def volumes(self) -> array:
+        return self._volumes
+
+    @property
+    def latest(self) -> Optional[int]:
+        return next((price for price, volume in zip(reversed(self._prices), reversed(self._volumes))
+                     if price and volume), None)
+
+    def update(self, points: Iterable[Tuple[int, int, int]]) -> None:
+        merged = dict(zip(self._dates, zip(self._prices, self._volumes)))
+        merged.update((date, (price, volume)) for date, price, volume in points)
+
+        if not merged:
+            return None
+
+        oldest = max(merged) - self.window if self.window else None
+        dates = sorted(date for date in merged if oldest is None or date >= oldest)
+
+        self._dates = array("q", dates)
+        self._prices = array("q", (merged[date][0] for date in dates))
+        self._volumes = array("q", (merged[date][1] for date in dates))
+
+    def update_from_resale_data(self, data: ResaleData) -> None:
+        self.update(data.points)
+
+    def since(self, days: int) -> "SalesHistory":
+        history = SalesHistory(self.window)
+
+        if self._dates:
+            start = bisect_left(self._dates, self._dates[-1] - days * DAY)
+
+            history._dates = self._dates[start:]
+            history._prices = self._prices[start:]
+            history._volumes = self._volumes[start:]
+
+        return history
+
+    def _traded_prices(self) -> array:
+        return array("q", (price for price, volume in zip(self._prices, self._volumes) if price and volume))
+
+    def percentile(self, q: float) -> Optional[float]:
+        prices = sorted(self._traded_prices())
+        if not prices:
+            return None
+
+        position = (len(prices) - 1) * min(max(q, 0), 100) / 100
+        lower, upper = math.floor(position), math.ceil(position)
+
+        return prices[lower] + (prices[upper] - prices[lower]) * (position - lower)
+
+    def median(self) -> Optional[float]:
+        return self.percentile(50)
+
+    def total_volume(self) -> int:
+        return sum(self._volumes)
+
+    def volume_weighted_average(self) -> Optional[float]:
+        volume = self.total_volume()
+        if not volume:
+            return None
+
+        return sum(price * volume for price, volume in zip(self._prices, self._volumes)) / volume
+
+    def trend(self) -> Optional[float]:
+        points = [(date / DAY, price) for date, price, volume in zip(self._dates, self._prices, self._volumes)
+                  if price and volume]
+        if len(points) < 2:
+            return None
+
+        count = len(points)
+        mean_x = sum(x for x, _ in points) / count
+        mean_y = sum(y for _, y in points) / count
+
+        variance = sum((x - mean_x) ** 2 for x, _ in points)
+        if not variance:
+            return None
+
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+    def clear(self) -> None:
+        self._dates = array("q")
+        self._prices = array("q")
+        self._volumes = array("q")
+
+    def __len__(self) -> int:
+        return len(self._dates)
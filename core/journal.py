@@ -0,0 +1,84 @@
+from os.path import basename
+import json
+import time
+
+from typing import Dict
+
+from .visuals import Display
+
+__all__ = ("SellJournal",)
+
+
+class SellJournal:
+    INTENDED = "intended"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._confirmed: Dict[str, int] = {}
+
+        torn = self._replay()
+        self._resumed = dict(self._confirmed)
+        self._file = open(filename, "a")
+
+        if torn:
+            self._file.write("\n")
+
+    def _replay(self) -> bool:
+        try:
+            f = open(self.filename, "r")
+        except FileNotFoundError:
+            return False
+
+        line = ""
+
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                self._apply(record)
+
+        return bool(line) and not line.endswith("\n")
+
+    def _apply(self, record: dict) -> None:
+        instance_id = record.get("instance_id")
+
+        match record.get("status"):
+            case self.CONFIRMED:
+                self._confirmed.update({instance_id: record.get("price")})
+            case self.FAILED if self._confirmed.get(instance_id) == record.get("price"):
+                self._confirmed.pop(instance_id)
+
+    def record(self, item_id: str, instance_id: str, price: int, status: str) -> None:
+        record = {
+            "item_id": item_id,
+            "instance_id": instance_id,
+            "price": price,
+            "status": status,
+            "time": int(time.time())
+        }
+        self._apply(record)
+
+        try:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+        except OSError as err:
+            Display.error(f"Failed to write into \"{basename(self.filename)}\": {err}")
+
+    def is_resumed(self, instance_id: str) -> bool:
+        return instance_id in self._resumed
+
+    def clear(self) -> None:
+        self._confirmed.clear()
+        self._resumed.clear()
+        self._file.truncate(0)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._confirmed)
@@ -1,2 +1,7 @@
 from .buy_checker import BuyChecker
 from .config_loader import ConfigLoader
+from .sell_pipeline import SellPipeline
+from .prefetcher import Prefetcher
+from .repricer import Repricer
+from .market_refresher import MarketRefresher
+from .floor_refresher import FloorRefresher
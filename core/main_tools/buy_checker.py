@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import deque
 from datetime import datetime
 import discord
 import asyncio
@@ -15,19 +14,21 @@ if TYPE_CHECKING:
 
 from ..detection import get_users_thumbnails, get_recent_sales
 from ..instances import Item, Collectible
-from ..clients import Auth
+from ..clients import Auth, sessions
+from ..payloads import parse_timestamp
 
 __all__ = ("BuyChecker",)
 
 
 class Transaction:
+    __slots__ = ("item_type", "item_id", "created_at", "sold_for", "buyer_id", "buyer_name")
+
     def __init__(self, transaction: dict) -> None:
         details = transaction["details"]
         self.item_type = details["type"]
         self.item_id = details["id"]
 
-        self.created_at = datetime.strptime(transaction["created"],
-                                            "%Y-%m-%dT%H:%M:%S.%fZ")
+        self.created_at = parse_timestamp(transaction["created"])
         self.sold_for = transaction["currency"]["amount"]
 
         buyer = transaction["agent"]
@@ -50,10 +51,10 @@ class Transaction:
         embed.set_footer(text="Was sold at")
         embed.set_thumbnail(url=item.thumbnail)
 
-        buyer_thumbnail = get_users_thumbnails((self.buyer_id,), auth)
+        buyer_thumbnails = await get_users_thumbnails((str(self.buyer_id),), auth)
         embed.set_author(name=self.buyer_name,
                          url=f"https://www.roblox.com/users/{self.buyer_id}/profile",
-                         icon_url=buyer_thumbnail)
+                         icon_url=buyer_thumbnails[0] if buyer_thumbnails else None)
 
         data = {
             "content": user_to_ping,
@@ -83,7 +84,7 @@ class BuyChecker:
         for sale in sales:
             if (
                 sale.item_type != "Asset"
-                or sale.created_at < self._seller.loaded_time
+                or sale.created_at < self._seller.loaded_time.timestamp()
             ):
                 continue
 
@@ -97,28 +98,22 @@ class BuyChecker:
         async for sale in self._fetch_existing_sales():
             item = self._seller.get_item(sale.item_id)
 
-            old_collectibles = item.collectibles.copy()
-            await item.fetch_collectibles()
-
-            for col in old_collectibles:
-                current = item.get_collectible(col.serial)
+            changes = await item.fetch_collectibles()
+            if changes is None:
+                continue
 
-                if (
-                    current is None
-                    or any(col.item.id == item.id and col.serial == current.serial
-                           for col in self.sold_items)
-                ):
+            for removed in changes.removed:
+                if any(col.item.id == item.id and col.serial == removed.serial
+                       for col in self.sold_items):
                     continue
 
-                yield sale, current
+                yield sale, removed
 
     async def send_webhook(self, collectible: Collectible, transaction: Transaction) -> None:
-        embed = transaction.make_embed(collectible, self._seller.auth, user_to_ping=self._seller.user_to_ping)
+        embed = await transaction.make_embed(collectible, self._seller.auth, user_to_ping=self._seller.user_to_ping)
 
-        async with self._seller.auth.post(self._seller.buy_webhook_url, json=embed) as response:
+        session = sessions.get("webhooks", rate_limiter=self._seller.auth.rate_limiter)
+
+        async with session.post(self._seller.buy_webhook_url, json=embed) as response:
             if response.status == 204:
                 self.sold_items.append(collectible)
-
-            elif response.status == 429:
-                await asyncio.sleep(30)
-                await self.send_webhook(collectible, transaction)
@@ -2,6 +2,7 @@ from typing import Optional, NoReturn
 
 from ..visuals import Display
 from ..utils import is_webhook_exists
+from ..pricing import PricingEngine
 
 __all__ = ("ConfigLoader",)
 
@@ -12,6 +13,11 @@ class ConfigLoader:
 
     def __init__(self, config: dict):
         self.presence_enabled = config["Discord_Rich_Presence"]
+        self.compact_collectibles = config.get("Compact_Collectibles", False)
+
+        request_metrics = config.get("Metrics", {})
+        self.metrics_enabled = request_metrics.get("Enabled", False)
+        self.metrics_port = request_metrics.get("Port", 9464)
 
         discord_bot = config["Discord_Bot"]
         self.discord_bot = discord_bot.get("Enabled", False)
@@ -33,17 +39,31 @@ class ConfigLoader:
         auto_sell = config["Auto_Sell"]
         self.auto_sell = not auto_sell.get("Ask_Before_Sell", False)
         self.save_progress = auto_sell.get("Save_Progress", True)
+        self.resume = auto_sell.get("Resume", True)
         self.skip_on_sale = auto_sell.get("Hide_OnSale", False)
         self.skip_if_cheapest = auto_sell.get("Skip_If_Cheapest", False)
         self.sort_items_by = auto_sell.get("Sort_Items_By", "name")
         self.keep_serials = auto_sell.get("Keep_Serials", 0)
         self.keep_copy = auto_sell.get("Keep_Copy", 0)
         self.creators_blacklist = auto_sell.get("Creators_Blacklist", [])
+        self.sell_concurrency = auto_sell.get("Sell_Concurrency", 5)
+        self.items_concurrency = auto_sell.get("Items_Concurrency", 3)
+        self.prefetch_window = auto_sell.get("Prefetch_Window", 5)
+        self.floor_refresh_interval = auto_sell.get("Floor_Refresh_Interval", 300)
+
+        reprice = auto_sell.get("Reprice", {})
+        self.auto_reprice = reprice.get("Enabled", False)
+        self.reprice_interval = reprice.get("Interval", 60)
 
         under_cut = auto_sell["Under_Cut"]
         self.under_cut_type = under_cut.get("Type", "percent").strip()
         self.under_cut_amount = under_cut.get("Value", 10)
 
+        pricing = auto_sell.get("Pricing", {})
+        self.pricing_strategy = pricing.get("Strategy", "lowest").strip()
+        self.pricing_percentile = pricing.get("Percentile", 50)
+        self.floor_margin = pricing.get("Floor_Margin", 10)
+
     async def handle_exceptions(self) -> Optional[NoReturn]:
         if self.discord_bot:
             if not self.bot_token:
@@ -68,3 +88,30 @@ class ConfigLoader:
 
         elif self.under_cut_amount < 0:
             return Display.exception("Under cut amount can not be less than 0")
+
+        elif self.pricing_strategy not in PricingEngine.strategies:
+            return Display.exception(f"Invalid pricing strategy provided, must be: {tuple(PricingEngine.strategies)}")
+
+        elif not 0 <= self.pricing_percentile <= 100:
+            return Display.exception("Pricing percentile must be between 0 and 100")
+
+        elif self.floor_margin < 0:
+            return Display.exception("Floor margin can not be less than 0")
+
+        elif self.sell_concurrency < 1:
+            return Display.exception("Sell concurrency can not be less than 1")
+
+        elif self.items_concurrency < 1:
+            return Display.exception("Items concurrency can not be less than 1")
+
+        elif self.prefetch_window < 0:
+            return Display.exception("Prefetch window can not be less than 0")
+
+        elif self.floor_refresh_interval < 0:
+            return Display.exception("Floor refresh interval can not be less than 0")
+
+        elif self.reprice_interval < 1:
+            return Display.exception("Reprice interval can not be less than 1 second")
+
+        elif not 0 <= self.metrics_port <= 65535:
+            return Display.exception("Metrics port must be between 0 and 65535")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AutoSeller
+
+from ..constants import ITEM_TYPES
+from ..detection import get_current_cap
+from ..visuals import Display
+
+__all__ = ("FloorRefresher",)
+
+
+class FloorRefresher:
+    def __init__(self, seller: AutoSeller, *, interval: Optional[int] = 300) -> None:
+        self._seller = seller
+        self.interval = interval
+
+    async def start(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.refresh()
+
+    async def refresh(self) -> Set[int]:
+        try:
+            items_cap = await get_current_cap(self._seller.auth)
+        except Exception:
+            return set()
+
+        if not items_cap:
+            return set()
+
+        changed = self._seller.pricing.update_floors(items_cap)
+        self._seller.items_cap = items_cap
+
+        if not changed:
+            return changed
+
+        repriced = self._seller.pricing.apply_floors(item for item in self._seller.items
+                                                     if item.asset_type in changed)
+
+        changed_types = ", ".join(ITEM_TYPES.get(asset_type, str(asset_type)) for asset_type in sorted(changed))
+        Display.info(f"Price floors changed for [g{changed_types}], repriced {repriced} items for the new floors")
+
+        return changed
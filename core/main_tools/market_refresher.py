@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from typing import Optional, List, Dict, Set, Tuple, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AutoSeller
+
+from ..detection import get_items_market_details
+from ..instances import Item
+
+__all__ = ("MarketRefresher",)
+
+
+class MarketRefresher:
+    def __init__(self, seller: AutoSeller, *,
+                 batch_size: Optional[int] = 30,
+                 delay: Optional[float] = 0.05,
+                 max_age: Optional[float] = 30) -> None:
+        self._seller = seller
+        self.batch_size = max(batch_size, 1)
+        self.delay = delay
+        self.max_age = max_age
+
+        self._recent: Dict[str, Tuple[float, dict]] = {}
+
+        self._pending: Dict[str, List[Item]] = {}
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def remember(self, market_details: Dict[str, dict]) -> None:
+        now = time.monotonic()
+        self._recent.update((item_id, (now, details)) for item_id, details in market_details.items())
+
+    def _take_recent(self, item_id: str) -> Optional[dict]:
+        recent = self._recent.pop(item_id, None)
+
+        if recent is None or time.monotonic() - recent[0] > self.max_age:
+            return None
+
+        return recent[1]
+
+    async def refresh(self, item: Item) -> bool:
+        details = self._take_recent(item.item_id)
+
+        if details is not None:
+            item.update_market_details(details)
+            return True
+
+        waiter = self._waiters.get(item.item_id)
+
+        if waiter is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.update({item.item_id: waiter})
+            self._pending.update({item.item_id: []})
+
+        self._pending[item.item_id].append(item)
+
+        if len(self._waiters) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.delay, self._flush)
+
+        return await asyncio.shield(waiter)
+
+    async def refresh_many(self, items: Iterable[Item]) -> List[Item]:
+        items = list(items)
+        market_details = await get_items_market_details((item.item_id for item in items), self._seller.auth)
+
+        refreshed = []
+
+        for item in items:
+            details = market_details.get(item.item_id)
+
+            if details is not None:
+                item.update_market_details(details)
+                refreshed.append(item)
+
+        return refreshed
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._waiters:
+            return None
+
+        pending, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, {}
+
+        task = asyncio.create_task(self._load(pending, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, pending: Dict[str, List[Item]], waiters: Dict[str, asyncio.Future]) -> None:
+        try:
+            market_details = await get_items_market_details(pending, self._seller.auth)
+        except Exception as err:
+            for waiter in waiters.values():
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return None
+
+        for item_id, items in pending.items():
+            details = market_details.get(item_id)
+
+            if details is not None:
+                for item in items:
+                    item.update_market_details(details)
+
+            if not waiters[item_id].done():
+                waiters[item_id].set_result(details is not None)
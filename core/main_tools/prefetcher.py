@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import Optional, Dict, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AutoSeller
+
+from ..instances import Item
+
+__all__ = ("Prefetcher",)
+
+
+class Prefetcher:
+    def __init__(self, seller: AutoSeller, *,
+                 window: Optional[int] = 5,
+                 concurrency: Optional[int] = 3) -> None:
+        self._seller = seller
+        self.window = max(window, 0)
+        self._semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._started: Set[int] = set()
+
+    async def _fetch(self, item: Item) -> None:
+        price_to_sell = item.price_to_sell
+
+        try:
+            refreshed, _ = await asyncio.gather(self._seller.market_refresher.refresh(item),
+                                                item.fetch_sales())
+            if not refreshed:
+                await item.fetch_resales(save_resales=False)
+        except Exception:
+            return None
+
+        if item.price_to_sell == price_to_sell:
+            item.price_to_sell = self._seller.define_price(item)
+
+    async def _fetch_queued(self, item: Item) -> None:
+        async with self._semaphore:
+            self._started.add(item.id)
+            await self._fetch(item)
+
+    def update(self) -> Optional[asyncio.Task]:
+        upcoming = self._seller.upcoming_items(self.window + 1)
+
+        if not upcoming:
+            return None
+
+        wanted = {item.id for item in upcoming}
+
+        for item_id in list(self._tasks):
+            if item_id not in wanted:
+                self.cancel(item_id)
+
+        current, *rest = upcoming
+
+        if current.id in self._tasks and current.id not in self._started:
+            self.cancel(current.id)
+
+        if current.id not in self._tasks:
+            self._started.add(current.id)
+            self._tasks.update({current.id: asyncio.create_task(self._fetch(current))})
+
+        for item in rest:
+            if item.id not in self._tasks:
+                self._tasks.update({item.id: asyncio.create_task(self._fetch_queued(item))})
+
+        return self._tasks[current.id]
+
+    def cancel(self, item_id: int) -> None:
+        task = self._tasks.pop(item_id, None)
+        self._started.discard(item_id)
+
+        if task is not None and not task.done():
+            task.cancel()
+
+    def cancel_all(self) -> None:
+        for item_id in list(self._tasks):
+            self.cancel(item_id)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import Optional, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AutoSeller
+
+from ..instances import Item, Collectible
+from ..visuals import Display
+
+__all__ = ("Repricer",)
+
+
+class Repricer:
+    def __init__(self, seller: AutoSeller, *, interval: Optional[int] = 60) -> None:
+        self._seller = seller
+        self.interval = interval
+
+    async def start(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    @staticmethod
+    def _listed_collectibles(item: Item) -> List[Collectible]:
+        return [col for col in item.collectibles
+                if col.on_sale and col.sale_price is not None and not col.skip_on_sale]
+
+    async def check(self) -> int:
+        if not self._seller.pricing.floors:
+            return 0
+
+        listed = [item for item in self._seller.items if self._listed_collectibles(item)]
+        if not listed:
+            return 0
+
+        semaphore = asyncio.Semaphore(self._seller.sell_concurrency)
+        tasks = []
+
+        for item in await self._seller.market_refresher.refresh_many(listed):
+            if not item.has_resales:
+                continue
+
+            collectibles = self._listed_collectibles(item)
+            current_price = min(col.sale_price for col in collectibles)
+
+            if item.lowest_resale_price >= current_price:
+                continue
+
+            await item.fetch_resales(depth=None, below=current_price)
+            if not item.has_resales:
+                continue
+
+            new_price = self._seller.pricing.unclamped_price(item)
+            if new_price < self._seller.get_price_floor(item) or new_price >= current_price:
+                continue
+
+            item.price_to_sell = new_price
+            tasks.append(self._reprice(item, [col for col in collectibles if col.sale_price > new_price],
+                                       new_price, item.resales.count_below(current_price), semaphore))
+
+        return sum(await asyncio.gather(*tasks))
+
+    async def _reprice(self, item: Item, collectibles: List[Collectible],
+                       price: int, undercuts: int, semaphore: asyncio.Semaphore) -> int:
+        async def limited_sell(col: Collectible) -> bool:
+            async with semaphore:
+                response = await col.sell(price, self._seller.auth, item.journal)
+                return getattr(response, "status", None) == 200
+
+        repriced = sum(await asyncio.gather(*(limited_sell(col) for col in collectibles)))
+
+        if repriced:
+            item.invalidate_resales()
+            Display.success(f"Repriced {repriced}x of {item.name} for $[g{price}] "
+                            f"after being undercut by {undercuts} listings")
+
+        return repriced
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from rgbprint import Color
+import asyncio
+
+from typing import Optional, Iterable, Callable, Awaitable, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AutoSeller
+
+from ..instances import Item
+from ..visuals import Display
+
+__all__ = ("SellPipeline",)
+
+_DONE = object()
+
+
+class SellPipeline:
+    def __init__(self, seller: AutoSeller, *, workers: Optional[int] = 3) -> None:
+        self._seller = seller
+        self.workers = max(workers, 1)
+        self.listed = 0
+
+        self._hydrate_queue = asyncio.Queue()
+
+    def feed(self, item: Item) -> None:
+        self._hydrate_queue.put_nowait(item)
+
+    def close(self) -> None:
+        self._hydrate_queue.put_nowait(_DONE)
+
+    async def start(self, items: Iterable[Item]) -> None:
+        for item in items:
+            self.feed(item)
+        self.close()
+
+        await self.run()
+
+    async def run(self) -> None:
+        price_queue = asyncio.Queue(maxsize=self.workers)
+        list_queue = asyncio.Queue(maxsize=self.workers)
+        report_queue = asyncio.Queue(maxsize=self.workers)
+
+        await asyncio.gather(
+            self._run_stage(self._hydrate, self._hydrate_queue, price_queue),
+            self._run_stage(self._price, price_queue, list_queue),
+            self._run_stage(self._list, list_queue, report_queue),
+            self._run_stage(self._report, report_queue)
+        )
+
+    async def _run_stage(self, handler: Callable[[Any], Awaitable[Any]],
+                         inbox: asyncio.Queue, outbox: Optional[asyncio.Queue] = None) -> None:
+        async def worker() -> None:
+            while (entry := await inbox.get()) is not _DONE:
+                try:
+                    result = await handler(entry)
+                except Exception as err:
+                    Display.error(f"Failed to process an item in the sell pipeline: {err}")
+                    continue
+
+                if result is not None and outbox is not None:
+                    await outbox.put(result)
+
+            await inbox.put(_DONE)
+
+        await asyncio.gather(*(worker() for _ in range(self.workers)))
+
+        if outbox is not None:
+            await outbox.put(_DONE)
+
+    async def _hydrate(self, item: Item) -> Optional[Item]:
+        if self._seller.resume and self._seller.was_put_on_sale(item):
+            if self._seller.save_progress:
+                self._seller.seen.add(item.id)
+
+            Display.skipping(f"[g{item.name}] was already put on sale before the restart")
+            return None
+
+        refreshed, _ = await asyncio.gather(self._seller.market_refresher.refresh(item),
+                                            item.fetch_sales())
+        if not refreshed:
+            await item.fetch_resales(save_resales=False)
+
+        return item
+
+    async def _price(self, item: Item) -> Item:
+        item.price_to_sell = self._seller.define_price(item)
+        return item
+
+    async def _list(self, item: Item) -> tuple[Item, Optional[int]]:
+        self.listed += 1
+        self._seller.show_progress(item, self.listed)
+
+        await Display.custom(
+            f"Selling [g{len(item)}x] of [g{item.name}] items...",
+            "selling", Color(255, 153, 0))
+
+        sold_amount = await item.sell_collectibles(
+            skip_on_sale=self._seller.skip_on_sale,
+            skip_if_cheapest=self._seller.skip_if_cheapest,
+            verbose=True,
+            concurrency=self._seller.sell_concurrency,
+            skip_confirmed=self._seller.resume
+        )
+
+        return item, sold_amount
+
+    async def _report(self, result: tuple[Item, Optional[int]]) -> None:
+        item, sold_amount = result
+
+        if sold_amount is not None:
+            self._seller.total_sold += sold_amount
+
+            if self._seller.sale_webhook and sold_amount > 0:
+                asyncio.create_task(self._seller.send_sale_webhook(item, sold_amount))
+
+        if self._seller.save_progress:
+            self._seller.seen.add(item.id)
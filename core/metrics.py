@@ -0,0 +1,174 @@
+from collections import Counter
+from bisect import bisect_left
+from aiohttp import web
+import aiohttp
+import re
+
+from typing import Optional, Dict, Tuple
+
+__all__ = ("RequestMetrics", "MetricsServer", "metrics", "endpoint_template")
+
+ID_SEGMENT_PATTERN = re.compile(r"\A(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})\Z")
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+TEMPLATED_HOST_SUFFIX = ".roblox.com"
+
+
+def endpoint_template(method: str, host: str, path: str) -> str:
+    if not host.endswith(TEMPLATED_HOST_SUFFIX):
+        return f"{method.upper()} {host}/{{path}}"
+
+    segments = ("{id}" if ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/"))
+    return f"{method.upper()} {host}{'/'.join(segments)}"
+
+
+class _EndpointStats:
+    __slots__ = ("statuses", "buckets", "latency_sum", "count", "bytes", "retries", "in_flight")
+
+    def __init__(self) -> None:
+        self.statuses = Counter()
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.count = 0
+        self.bytes = 0
+        self.retries = 0
+        self.in_flight = 0
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+
+        for bound, amount in zip((*LATENCY_BUCKETS, float("inf")), self.buckets):
+            seen += amount
+
+            if seen >= rank:
+                return bound
+
+        return float("inf")
+
+
+class RequestMetrics:
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, _EndpointStats] = {}
+
+    def get(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+
+        if stats is None:
+            stats = _EndpointStats()
+            self._endpoints.update({endpoint: stats})
+
+        return stats
+
+    def started(self, endpoint: str) -> None:
+        self.get(endpoint).in_flight += 1
+
+    def finished(self, endpoint: str, status: Optional[int], latency: float) -> None:
+        stats = self.get(endpoint)
+
+        stats.in_flight -= 1
+        stats.count += 1
+        stats.latency_sum += latency
+        stats.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        stats.statuses[status or "error"] += 1
+
+    def received(self, endpoint: str, size: int) -> None:
+        self.get(endpoint).bytes += size
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        async def on_chunk(_, context, params: aiohttp.TraceResponseChunkReceivedParams) -> None:
+            if isinstance(context.trace_request_ctx, dict) and "endpoint" in context.trace_request_ctx:
+                self.received(context.trace_request_ctx["endpoint"], len(params.chunk))
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_response_chunk_received.append(on_chunk)
+
+        return trace_config
+
+    def retried(self, endpoint: str) -> None:
+        self.get(endpoint).retries += 1
+
+    @property
+    def total_requests(self) -> int:
+        return sum(stats.count for stats in self._endpoints.values())
+
+    def clear(self) -> None:
+        self._endpoints.clear()
+
+    def render(self) -> str:
+        endpoints = [(f'endpoint="{endpoint}"', stats) for endpoint, stats in sorted(self._endpoints.items())]
+        lines = ["# TYPE autoseller_requests_total counter"]
+
+        for label, stats in endpoints:
+            for status, amount in sorted(stats.statuses.items(), key=lambda x: str(x[0])):
+                lines.append(f'autoseller_requests_total{{{label},status="{status}"}} {amount}')
+
+        lines.append("# TYPE autoseller_request_duration_seconds histogram")
+
+        for label, stats in endpoints:
+            cumulative = 0
+            for bound, amount in zip((*LATENCY_BUCKETS, "+Inf"), stats.buckets):
+                cumulative += amount
+                lines.append(f'autoseller_request_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+
+            lines.extend((f"autoseller_request_duration_seconds_sum{{{label}}} {stats.latency_sum:.6f}",
+                          f"autoseller_request_duration_seconds_count{{{label}}} {stats.count}"))
+
+        for family, kind, attribute in (("autoseller_response_bytes_total", "counter", "bytes"),
+                                        ("autoseller_request_retries_total", "counter", "retries"),
+                                        ("autoseller_requests_in_flight", "gauge", "in_flight")):
+            lines.append(f"# TYPE {family} {kind}")
+            lines.extend(f"{family}{{{label}}} {getattr(stats, attribute)}" for label, stats in endpoints)
+
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, str]:
+        summary = {}
+
+        for endpoint, stats in sorted(self._endpoints.items(), key=lambda x: -x[1].count):
+            if not stats.count:
+                continue
+
+            statuses = ", ".join(f"{status}: {amount}" for status, amount in stats.statuses.most_common())
+            summary.update({endpoint: f"{stats.count}x, avg {stats.latency_sum / stats.count * 1000:.0f}ms, "
+                                      f"p95 <{stats.quantile(0.95)}s, retries {stats.retries} ({statuses})"})
+
+        return summary
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+
+metrics = RequestMetrics()
+
+
+class MetricsServer:
+    def __init__(self, request_metrics: RequestMetrics = metrics, *,
+                 host: str = "127.0.0.1", port: int = 9464) -> None:
+        self.metrics = request_metrics
+        self.host = host
+        self.port = port
+
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle_metrics(self, _: web.Request) -> web.Response:
+        return web.Response(text=self.metrics.render(), content_type="text/plain")
+
+    async def start(self) -> Tuple[str, int]:
+        app = web.Application()
+        app.add_routes([web.get("/metrics", self._handle_metrics)])
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        return self.host, self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
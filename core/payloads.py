@@ -0,0 +1,167 @@
+from datetime import datetime, timezone
+import json
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+from typing import Optional, List, Tuple, Any
+
+__all__ = ("loads", "read_json", "parse_timestamp", "InventoryAsset", "CatalogDetails",
+           "ResellableInstance", "Resale", "ResellersPage", "ResaleData")
+
+loads = orjson.loads if orjson is not None else json.loads
+
+DAY = 24 * 60 * 60
+EPOCH_ORDINAL = 719163
+DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+async def read_json(response) -> Any:
+    return loads(await response.read())
+
+
+def _days_since_epoch(year: int, month: int, day: int) -> int:
+    past = year - 1
+    days = past * 365 + past // 4 - past // 100 + past // 400 + DAYS_BEFORE_MONTH[month] + day
+
+    if month > 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days += 1
+
+    return days - EPOCH_ORDINAL
+
+
+def _parse_timestamp(value: str) -> float:
+    if len(value) < 19 or value[4] != "-" or value[10] not in "T " or value[13] != ":":
+        date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return (date if date.tzinfo else date.replace(tzinfo=timezone.utc)).timestamp()
+
+    seconds = (_days_since_epoch(int(value[0:4]), int(value[5:7]), int(value[8:10])) * DAY
+               + int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19]))
+
+    end = 19
+    if value[end:end + 1] == ".":
+        end += 1
+
+        while end < len(value) and value[end].isdigit():
+            end += 1
+
+        seconds += int(value[20:end] or 0) / 10 ** (end - 20)
+
+    offset = value[end:]
+    if offset and offset != "Z":
+        sign = 1 if offset[0] == "+" else -1
+        seconds -= sign * (int(offset[1:3]) * 3600 + int(offset[-2:]) * 60)
+
+    return seconds
+
+
+def parse_timestamp(value: str) -> float:
+    try:
+        date = datetime.fromisoformat(value)
+    except ValueError:
+        return _parse_timestamp(value)
+
+    return (date if date.tzinfo else date.replace(tzinfo=timezone.utc)).timestamp()
+
+
+class InventoryAsset:
+    __slots__ = ("asset_id", "collectible_item_id", "instance_id", "serial", "name")
+
+    def __init__(self, asset_id: int, collectible_item_id: str, instance_id: Optional[str],
+                 serial: Optional[int], name: Optional[str]) -> None:
+        self.asset_id = asset_id
+        self.collectible_item_id = collectible_item_id
+        self.instance_id = instance_id
+        self.serial = serial
+        self.name = name
+
+    @classmethod
+    def from_json(cls, data: dict) -> "InventoryAsset":
+        return cls(data["assetId"], data["collectibleItemId"], data.get("collectibleItemInstanceId"),
+                   data.get("serialNumber"), data.get("assetName"))
+
+
+class CatalogDetails:
+    __slots__ = ("asset_type", "price", "total_quantity", "lowest_resale_price",
+                 "creator_id", "creator_name")
+
+    def __init__(self, asset_type: Optional[int], price: Optional[int], total_quantity: Optional[int],
+                 lowest_resale_price: Optional[int], creator_id: Optional[int],
+                 creator_name: Optional[str]) -> None:
+        self.asset_type = asset_type
+        self.price = price
+        self.total_quantity = total_quantity
+        self.lowest_resale_price = lowest_resale_price
+        self.creator_id = creator_id
+        self.creator_name = creator_name
+
+    @classmethod
+    def from_json(cls, data: dict) -> "CatalogDetails":
+        return cls(data.get("assetType"), data.get("price"), data.get("totalQuantity"),
+                   data.get("lowestResalePrice"), data.get("creatorTargetId"), data.get("creatorName"))
+
+
+class ResellableInstance:
+    __slots__ = ("serial", "on_sale", "price", "item_id", "instance_id", "product_id")
+
+    def __init__(self, serial: int, on_sale: bool, price: Optional[int], item_id: str,
+                 instance_id: str, product_id: Optional[str]) -> None:
+        self.serial = serial
+        self.on_sale = on_sale
+        self.price = price
+        self.item_id = item_id
+        self.instance_id = instance_id
+        self.product_id = product_id
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ResellableInstance":
+        return cls(data["serialNumber"], data.get("saleState") == "OnSale", data.get("price"),
+                   data["collectibleItemId"], data["collectibleInstanceId"], data.get("collectibleProductId"))
+
+
+class Resale:
+    __slots__ = ("price", "serial", "seller_id", "seller_name")
+
+    def __init__(self, price: int, serial: int, seller_id: Optional[int], seller_name: Optional[str]) -> None:
+        self.price = price
+        self.serial = serial
+        self.seller_id = seller_id
+        self.seller_name = seller_name
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Resale":
+        seller = data.get("seller") or {}
+        return cls(data["price"], data["serialNumber"], seller.get("sellerId"), seller.get("name"))
+
+
+class ResellersPage:
+    __slots__ = ("resales", "next_cursor")
+
+    def __init__(self, resales: List[Resale], next_cursor: Optional[str]) -> None:
+        self.resales = resales
+        self.next_cursor = next_cursor
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ResellersPage":
+        return cls([Resale.from_json(resale) for resale in data["data"]], data.get("nextPageCursor"))
+
+
+class ResaleData:
+    __slots__ = ("recent_average_price", "points")
+
+    def __init__(self, recent_average_price: float, points: List[Tuple[int, int, int]]) -> None:
+        self.recent_average_price = recent_average_price
+        self.points = points
+
+    @property
+    def latest_price(self) -> Optional[int]:
+        return self.points[0][1] if self.points else None
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ResaleData":
+        points = [(int(parse_timestamp(price["date"])), int(price["value"]), int(volume["value"]))
+                  for price, volume in zip(data.get("priceDataPoints") or (), data.get("volumeDataPoints") or ())]
+
+        return cls(data.get("recentAveragePrice") or 0, points)
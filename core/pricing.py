@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Optional, Dict, Set, Iterable, Callable, Literal, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .instances import Item
+
+from .constants import ITEM_TYPES
+
+__all__ = ("min_sale_price", "undercut_price", "PricingEngine")
+
+
+def min_sale_price(price: int) -> int:
+    return price - price % 2
+
+
+def undercut_price(price: int, undercut_amount: int, undercut_type: Literal["robux", "percent"]) -> int:
+    if undercut_type == "robux":
+        return price - undercut_amount
+
+    return round(price - (price / 100 * undercut_amount))
+
+
+class PricingEngine:
+    strategies: Dict[str, Callable[[PricingEngine, Item, int], Optional[int]]] = {}
+
+    def __init__(
+        self,
+        strategy: str = "lowest",
+        *,
+        undercut_type: Literal["robux", "percent"] = "percent",
+        undercut_amount: int = 10,
+        percentile: float = 50,
+        floor_margin: float = 10
+    ) -> None:
+        self.strategy = strategy
+        self.undercut_type = undercut_type
+        self.undercut_amount = undercut_amount
+        self.percentile = percentile
+        self.floor_margin = floor_margin
+
+        self.floors: Dict[int, int] = {}
+
+    @classmethod
+    def register(cls, name: str):
+        def decorator(func: Callable[[PricingEngine, Item, int], Optional[int]]):
+            cls.strategies.update({name: func})
+            return func
+
+        return decorator
+
+    def update_floors(self, items_cap: Optional[dict]) -> Set[int]:
+        if not items_cap:
+            return set()
+
+        floors = {asset_type: items_cap[name]["priceFloor"]
+                  for asset_type, name in ITEM_TYPES.items() if name in items_cap}
+        changed = {asset_type for asset_type in floors.keys() | self.floors.keys()
+                   if floors.get(asset_type) != self.floors.get(asset_type)}
+
+        self.floors = floors
+        return changed
+
+    def get_floor(self, item: Item) -> int:
+        return self.floors.get(item.asset_type, 0)
+
+    def undercut(self, price: int) -> int:
+        return undercut_price(price, self.undercut_amount, self.undercut_type)
+
+    def unclamped_price(self, item: Item) -> int:
+        floor = self.get_floor(item)
+        strategy = self.strategies.get(self.strategy, self.strategies["lowest"])
+
+        price = strategy(self, item, floor)
+        if price is None and strategy is not self.strategies["lowest"]:
+            price = self.strategies["lowest"](self, item, floor)
+
+        return min_sale_price(price or 0)
+
+    def price(self, item: Item) -> int:
+        return max(self.unclamped_price(item), self.get_floor(item))
+
+    def price_many(self, items: Iterable[Item]) -> Dict[int, int]:
+        return {item.id: self.price(item) for item in items}
+
+    def apply_floors(self, items: Iterable[Item]) -> int:
+        repriced = 0
+
+        for item in items:
+            if item.manual_price:
+                continue
+
+            price = self.price(item)
+
+            if item.price_to_sell != price:
+                item.price_to_sell = price
+                repriced += 1
+
+        return repriced
+
+
+@PricingEngine.register("lowest")
+def _lowest_price(engine: PricingEngine, item: Item, _: int) -> Optional[int]:
+    if not item.lowest_resale_price:
+        return None
+
+    return engine.undercut(item.lowest_resale_price)
+
+
+@PricingEngine.register("rap")
+def _rap_price(engine: PricingEngine, item: Item, _: int) -> Optional[int]:
+    if not item.recent_average_price:
+        return None
+
+    return engine.undercut(item.recent_average_price)
+
+
+@PricingEngine.register("percentile")
+def _percentile_price(engine: PricingEngine, item: Item, _: int) -> Optional[int]:
+    price = item.sales.percentile(engine.percentile)
+    if not price:
+        return None
+
+    return engine.undercut(round(price))
+
+
+@PricingEngine.register("floor_margin")
+def _floor_margin_price(engine: PricingEngine, _: Item, floor: int) -> Optional[int]:
+    if not floor:
+        return None
+
+    return round(floor + floor / 100 * engine.floor_margin)
@@ -2,11 +2,11 @@ import asyncio
 from os.path import basename
 import json
 
-from typing import Union, Any, Iterable, Optional, Literal
+from typing import Union, Any, Iterable, Optional
 
 from .visuals import Display
 from .constants import WEBHOOK_PATTERN
-from .clients import ClientSession
+from .clients import sessions
 
 
 class IgnoreNew:
@@ -112,40 +112,19 @@ def load_file(file_path: str) -> dict:
         return Display.exception(f"Failed to load \"{file_name}\" file: {err}")
 
 
-def define_sale_price(undercut_amount: int, undercut_type: Literal["amount", "percent"],
-                      limit_price: int, lowest_price: int) -> int:
-    def min_sale(price: int) -> int:
-        profit = price // 2
-
-        while (price // 2) >= profit:
-            price -= 1
-
-        return price + 1
-
-    if undercut_type == "amount":
-        final_price = lowest_price - undercut_amount
-    else:
-        final_price = round(lowest_price - (lowest_price / 100 * undercut_amount))
-
-    final_price = min_sale(final_price)
-    return final_price if final_price > limit_price else limit_price
-
-
 async def is_webhook_exists(webhook_url: str) -> bool:
     if not WEBHOOK_PATTERN.match(webhook_url):
         return False
 
-    async with ClientSession() as session:
-        async with session.get(webhook_url) as response:
-            return True if (await response.json()).get("name") is not None else False
+    async with sessions.get().get(webhook_url) as response:
+        return True if (await response.json()).get("name") is not None else False
 
 
 async def check_for_update(code_url: str, _version: str) -> bool:
-    async with ClientSession() as session:
-        async with session.get(code_url) as response:
-            try:
-                version = (await response.text()).strip().split("VERSION = \"")[1].split("\"")[0]
-            except IndexError:
-                return False
-
-            return True if version != _version else False
+    async with sessions.get().get(code_url) as response:
+        try:
+            version = (await response.text()).strip().split("VERSION = \"")[1].split("\"")[0]
+        except IndexError:
+            return False
+
+        return True if version != _version else False
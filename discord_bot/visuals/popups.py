@@ -28,5 +28,6 @@ class SetPricePopup(Modal, title="New Price Set"):
 
         if self.new_price.value.isdigit() and int(self.new_price.value) > 0:
             self.view.seller.current.price_to_sell = int(self.new_price.value)
+            self.view.seller.current.manual_price = True
 
         await self.view.update_message(self.view.make_embed())
@@ -62,7 +62,9 @@ class ControlPanel(BaseView):
 
     def make_embed(self) -> discord.Embed:
         item = self.seller.current
-        
+        if item is None:
+            return loading_embed("Loading your items")
+
         embed = discord.Embed(title=item.name,
                               url=item.link,
                               timestamp=datetime.now(),
@@ -85,7 +87,7 @@ class ControlPanel(BaseView):
         embed.set_author(name=item.creator_name, url=item.creator_link)
         embed.set_thumbnail(url=item.thumbnail)
 
-        embed.set_footer(text=f"Viewing {self.seller.current_index + 1}/{len(self.seller.items) + 1}")
+        embed.set_footer(text=f"Viewing {self.seller.current_index + 1}/{len(self.seller.items)}")
 
         return embed
 
@@ -93,7 +95,7 @@ class ControlPanel(BaseView):
     @_permission_check
     async def sell_button(self, interaction: discord.Interaction, _: discord.ui.Button):
         self.switch_buttons_disabling(True)
-        await self.update_message(embed=loading_embed(f"Selling {len(self.seller.current.collectibles):,} Items"))
+        await self.update_message(embed=loading_embed(f"Selling {len(self.seller.current):,} Items"))
         await interaction.response.defer(ephemeral=True)
         
         if not self.seller.selling:
@@ -101,7 +103,9 @@ class ControlPanel(BaseView):
                 sold_amount = await self.seller.current.sell_collectibles(
                     skip_on_sale=self.seller.skip_on_sale,
                     skip_if_cheapest=self.seller.skip_if_cheapest,
-                    verbose=False
+                    verbose=False,
+                    concurrency=self.seller.sell_concurrency,
+                    skip_confirmed=self.seller.resume
                 )
 
                 if sold_amount is None:
@@ -135,6 +139,7 @@ class ControlPanel(BaseView):
     @_permission_check
     async def next_button(self, interaction: discord.Interaction, _):
         self.seller.blacklist.add(self.seller.current.id)
+        self.seller.prefetcher.cancel(self.seller.current.id)
         self.seller.next_item()
         
         await self.update_message(self.make_embed())
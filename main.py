@@ -15,7 +15,7 @@ try:
     from traceback import format_exc
     from pypresence import AioPresence, DiscordNotFound
 
-    from typing import List, Optional, Any, Union, AsyncGenerator, Iterable, TYPE_CHECKING
+    from typing import List, Dict, Set, Optional, Any, Union, AsyncGenerator, Iterable, Callable, NoReturn, TYPE_CHECKING
     from discord.errors import LoginFailure
     from asyncio import Task
     if TYPE_CHECKING:
@@ -24,9 +24,14 @@ try:
     from core.instances import *
     from core.main_tools import *
     from core.clients import *
+    from core.metrics import *
+    from core.payloads import *
     from core.visuals import *
     from core.detection import *
     from core.utils import *
+    from core.journal import *
+    from core.cache import *
+    from core.pricing import *
     from core.constants import VERSION, RAW_CODE_URL, ITEM_TYPES, PRESENCE_BOT_ID, URL_REPOSITORY
     from discord_bot import start as discord_bot_start
 
@@ -52,110 +57,153 @@ __all__ = ("AutoSeller",)
 
 
 class AutoSeller(ConfigLoader):
-    __slots__ = ("config", "_items", "auth", "buy_checker", "blacklist",
-                 "seen", "not_resable", "current_index", "done",
-                 "total_sold", "selling", "loaded_time", "control_panel")
+    __slots__ = ("config", "_items", "auth", "buy_checker", "repricer", "floor_refresher",
+                 "blacklist", "seen", "not_resable", "journal", "catalog_cache",
+                 "prefetcher", "market_refresher", "pricing", "done",
+                 "total_sold", "selling", "loaded_time", "control_panel",
+                 "items_cap", "metrics_server")
 
     def __init__(self,
                  config: dict,
                  blacklist: FileSync,
                  seen: FileSync,
-                 not_resable: FileSync) -> None:
+                 not_resable: FileSync,
+                 journal: Optional[SellJournal] = None,
+                 catalog_cache: Optional[CatalogCache] = None) -> None:
         super().__init__(config)
         
         self.config = config
 
-        self._items = dict()
+        self._items = ItemRegistry()
         self.auth = Auth(config.get("Cookie", "").strip())
         self.buy_checker = BuyChecker(self)
+        self.repricer = Repricer(self, interval=self.reprice_interval)
+        self.floor_refresher = FloorRefresher(self, interval=self.floor_refresh_interval)
+        self.market_refresher = MarketRefresher(self)
+        self.pricing = PricingEngine(self.pricing_strategy,
+                                     undercut_type=self.under_cut_type,
+                                     undercut_amount=self.under_cut_amount,
+                                     percentile=self.pricing_percentile,
+                                     floor_margin=self.floor_margin)
+        self.prefetcher = Prefetcher(self, window=self.prefetch_window,
+                                     concurrency=self.items_concurrency)
+        self.metrics_server = MetricsServer(metrics, port=self.metrics_port)
 
         self.blacklist = blacklist
         self.seen = seen
         self.not_resable = not_resable
+        self.journal = journal
+        self.catalog_cache = catalog_cache
 
         if self.presence_enabled:
             self.rich_presence = AioPresence(PRESENCE_BOT_ID)
 
-        self.current_index = 0
         self.done = False
         self.total_sold = 0
         self.selling = WithBool()
         self.loaded_time: datetime = None
         self.control_panel: ControlPanel = None
+        self.items_cap: dict = None
 
     @property
-    def items(self) -> List[Item]:
-        return list(self._items.values())
+    def items(self) -> ItemRegistry:
+        return self._items
+
+    @property
+    def streams_items(self) -> bool:
+        return self.auto_sell and not self.keep_copy and not self.keep_serials
 
     @property
     def current(self) -> Item:
-        return self.items[self.current_index]
+        return self._items.current
+
+    @property
+    def current_index(self) -> int:
+        return self._items.index
 
     def get_item(self, _id: int, default: Optional[Any] = None) -> Union[Item, Any]:
         return self._items.get(_id, default)
 
     def add_item(self, item: Item) -> Item:
-        self._items.update({item.id: item})
-        return item
+        return self._items.add(item)
 
     def remove_item(self, _id: int) -> Item:
-        return self._items.pop(_id)
+        return self._items.remove(_id)
+
+    def upcoming_items(self, count: int) -> List[Item]:
+        return self._items.upcoming(count)
 
-    def next_item(self, *, step_index: int = 1) -> None:
-        self.current_index = (self.current_index + 1) % len(self.items)
+    def next_item(self) -> None:
+        wrapped = not self._items.advance()
 
         if self.presence_enabled:
             asyncio.create_task(self.update_presence())
 
-        if not self.current_index:
+        if wrapped:
             self.done = True
+            self.prefetcher.cancel_all()
+            return None
 
-        self.fetch_item_info(step_index=step_index)
+        self.fetch_item_info()
+
+    async def update_presence(self, item: Optional[Item] = None, position: Optional[int] = None) -> None:
+        item = item or self.current
+        if item is None:
+            return None
 
-    async def update_presence(self) -> None:
         easter_egg = random() < 0.3
 
         await self.rich_presence.update(
-            state=f"{self.current_index + 1} out of {len(self.items)}",
-            details=f"Selling {self.current.name} limited",
-            large_image=self.current.thumbnail if not easter_egg else "https://cdn.discordapp.com/avatars/1284536257958903808/fa4fba77caa6cc68f2972e2ea33e67a5.png?size=4096",
-            large_text=f"{self.current.name} limited" if not easter_egg else "Pisun easter egg (3% chance)",
+            state=f"{position or self.current_index + 1} out of {len(self.items)}",
+            details=f"Selling {item.name} limited",
+            large_image=item.thumbnail if not easter_egg else "https://cdn.discordapp.com/avatars/1284536257958903808/fa4fba77caa6cc68f2972e2ea33e67a5.png?size=4096",
+            large_text=f"{item.name} limited" if not easter_egg else "Pisun easter egg (3% chance)",
             small_image="https://cdn.discordapp.com/app-assets/1005469189907173486/1025422070600978553.png?size=160",
             small_text="Roblox",
-            buttons=[{"url": self.current.link, "label": "Selling Item"},
+            buttons=[{"url": item.link, "label": "Selling Item"},
                      {"url": URL_REPOSITORY, "label": "Use Tool Yourself"}],
             start=int(self.loaded_time.timestamp())
         )
 
-    async def filter_non_resable(self):
-        if (self.current_index + 2) % 30 or not self.current_index:
+    def show_progress(self, item: Item, position: int) -> None:
+        if self.presence_enabled:
+            asyncio.create_task(self.update_presence(item, position))
+
+    def fetch_item_info(self) -> Optional[Task]:
+        return self.prefetcher.update()
+
+    def resume_progress(self) -> None:
+        if not self.journal:
             return None
 
-        async with self.auth.post(
-            "apis.roblox.com/marketplace-items/v1/items/details",
-            json={"itemIds": [i.item_id for i in self.items[self.current_index:30]]}
-        ) as response:
-            for item_details in await response.json():
-                item_id = item_details["itemTargetId"]
+        skipped = 0
 
-                if item_details["resaleRestriction"] == 1:
-                    self.not_resable.add(item_id)
-                    self.remove_item(item_id)
+        for item in self.items:
+            if self.was_put_on_sale(item):
+                self.remove_item(item.id)
+                skipped += 1
 
-    def fetch_item_info(self, *, step_index: int = 1) -> Optional[Iterable[Task]]:
-        try:
-            item = self.items[self.current_index + step_index]
-        except IndexError:
-            return None
+                if self.save_progress:
+                    self.seen.add(item.id)
 
-        return (
-            asyncio.create_task(item.fetch_sales(save_sales=False)),
-            asyncio.create_task(item.fetch_resales(save_resales=False)),
-            asyncio.create_task(self.filter_non_resable())
-        )
+        if skipped:
+            Display.info(f"Skipped [g{skipped}] items that were already put on sale before the restart")
+
+        if not self.items:
+            self.done = True
+
+    def was_put_on_sale(self, item: Item) -> bool:
+        sellable = [col for col in item.collectibles if not col.skip_on_sale]
+        return bool(sellable) and all(item.is_resumed(col) for col in sellable)
+
+    def get_price_floor(self, item: Item) -> int:
+        return self.pricing.get_floor(item)
+
+    def define_price(self, item: Item) -> int:
+        return self.pricing.price(item)
 
     def sort_items(self, _type: str) -> None:
-        self._items = dict(sorted(self._items.items(), key=lambda x: getattr(x[1], _type)))
+        self._items.sort(key=lambda item: getattr(item, _type))
 
     async def start(self):
         await asyncio.gather(self.auth.fetch_csrf_token(),
@@ -163,28 +211,40 @@ class AutoSeller(ConfigLoader):
 
         Display.info("Checking cookie to be valid")
         if await self.auth.fetch_user_info() is None:
-            return Display.exception("Invalid cookie provided")
+            return await self.abort("Invalid cookie provided")
 
         Display.info("Checking premium owning")
         if not await self.auth.fetch_premium():
-            return Display.exception("You dont have premium to sell limiteds")
+            return await self.abort("You dont have premium to sell limiteds")
 
-        await self._load_items()
-        self.sort_items("name")
+        if not self.streams_items:
+            await self._load_items()
+            self.sort_items("name")
+            self._items.reset()
 
         if self.presence_enabled:
             try:
                 await self.rich_presence.connect()
-                await self.update_presence()
+                if self.items:
+                    await self.update_presence()
             except DiscordNotFound:
-                return Display.exception("Could find Discord running to show presence")
+                return await self.abort("Could find Discord running to show presence")
+
+        if self.metrics_enabled:
+            try:
+                host, port = await self.metrics_server.start()
+            except OSError as err:
+                return await self.abort(f"Could not start metrics server: {err}")
+
+            Display.info(f"Serving request metrics on http://{host}:{port}/metrics")
 
         try:
             async with self:
                 tasks = (
                     discord_bot_start(self) if self.discord_bot else None,
                     self.buy_checker.start() if self.buy_webhook else None,
-                    self.auth.csrf_token_updater(),
+                    self.repricer.start() if self.auto_reprice else None,
+                    self.floor_refresher.start() if self.floor_refresh_interval else None,
                     self.start_selling()
                 )
                 await asyncio.gather(*filter(None, tasks))
@@ -194,14 +254,21 @@ class AutoSeller(ConfigLoader):
             return Display.exception(f"Unknown error occurred:\n\n{format_exc()}")
 
     async def start_selling(self):
-        for i in range(2):
-            for task in self.fetch_item_info(step_index=i):
-                await task
+        if self.resume and not self.streams_items:
+            self.resume_progress()
 
         if self.auto_sell: await self._auto_sell_items()
         else: await self._manual_selling()
 
+        if self.journal is not None:
+            self.journal.clear()
+
         Tools.clear_console()
+
+        request_summary = metrics.summary()
+        if request_summary:
+            Display.sections({"Requests": request_summary})
+
         await Display.custom(
             f"Sold [g{self.total_sold}x] items",
             "done", Color(207, 222, 0))
@@ -215,13 +282,15 @@ class AutoSeller(ConfigLoader):
 
     async def sell_item(self):
         await Display.custom(
-            f"Selling [g{len(self.current.collectibles)}x] of [g{self.current.name}] items...",
+            f"Selling [g{len(self.current)}x] of [g{self.current.name}] items...",
             "selling", Color(255, 153, 0))
 
         sold_amount = await self.current.sell_collectibles(
             skip_on_sale=self.skip_on_sale,
             skip_if_cheapest=self.skip_if_cheapest,
-            verbose=True
+            verbose=True,
+            concurrency=self.sell_concurrency,
+            skip_confirmed=self.resume
         )
 
         if sold_amount is not None:
@@ -236,11 +305,26 @@ class AutoSeller(ConfigLoader):
         self.next_item()
 
     async def _auto_sell_items(self):
-        while not self.done:
-            await self.sell_item()
-            await asyncio.sleep(0.5)
+        pipeline = SellPipeline(self, workers=self.items_concurrency)
+
+        if self.streams_items:
+            await asyncio.gather(self._stream_items(pipeline), pipeline.run())
+        else:
+            await pipeline.start(self.items)
+
+        self.done = True
+
+    async def _stream_items(self, pipeline: SellPipeline) -> None:
+        try:
+            await self._load_items(on_item=pipeline.feed)
+        finally:
+            pipeline.close()
 
     async def _manual_selling(self):
+        current = self.fetch_item_info()
+        if current is not None:
+            await current
+
         while not self.done:
             await self.update_console()
             choice = (await aioconsole.ainput()).strip()
@@ -270,10 +354,12 @@ class AutoSeller(ConfigLoader):
                         continue
 
                     self.current.price_to_sell = int(new_price)
+                    self.current.manual_price = True
 
                     Display.success(f"Successfully set a new price to sell! ([g${self.current.price_to_sell}])")
                 case "3":
                     self.blacklist.add(self.current.id)
+                    self.prefetcher.cancel(self.current.id)
                     self.next_item()
 
                     Display.success(f"Successfully added [g{self.current.name} ({self.current.id})] into a blacklist!")
@@ -283,66 +369,206 @@ class AutoSeller(ConfigLoader):
 
                     self.next_item()
                     Display.skipping(
-                        f"Skipped [g{len(self.current.collectibles)}x] collectibles")
+                        f"Skipped [g{len(self.current)}x] collectibles")
                 case _:
                     continue
 
             await asyncio.sleep(0.7)
 
-    async def __fetch_items(self) -> AsyncGenerator:
+    @staticmethod
+    def __merge_market_details(items_details: Dict[str, dict], market_details: Dict[str, dict]) -> Dict[str, dict]:
+        merged = {}
+
+        for item_id, details in items_details.items():
+            market = market_details.get(details.get("collectibleItemId"))
+            if market is None:
+                continue
+
+            details.update({
+                "price": market.get("price", details.get("price")),
+                "lowestResalePrice": market.get("lowestResalePrice", market.get("lowestPrice"))
+            })
+            merged.update({item_id: details})
+
+        return merged
+
+    async def __lookup_assets(self, collectible_ids: Dict[str, str]) -> tuple[Dict[str, dict], Dict[str, str]]:
+        market_details = await get_items_market_details(collectible_ids.values(), self.auth)
+        self.market_refresher.remember(market_details)
+
+        restricted = {int(item_id) for item_id, collectible_id in collectible_ids.items()
+                      if market_details.get(collectible_id, {}).get("resaleRestriction") == 1}
+        if restricted:
+            self.not_resable.update(restricted)
+
+        item_ids = [item_id for item_id in collectible_ids if int(item_id) not in restricted]
+
+        if self.catalog_cache is None:
+            return await asyncio.gather(
+                get_items_details(item_ids, self.auth),
+                get_assets_thumbnails(item_ids, self.auth)
+            )
+
+        (items_details, stale_details), items_thumbnails = await asyncio.gather(
+            self.catalog_cache.get_details(item_ids),
+            self.catalog_cache.get_thumbnails(item_ids)
+        )
+
+        refreshed = self.__merge_market_details(stale_details, market_details)
+
+        new_details, new_thumbnails = await asyncio.gather(
+            get_items_details([i for i in item_ids if i not in items_details and i not in refreshed], self.auth),
+            get_assets_thumbnails([i for i in item_ids if i not in items_thumbnails], self.auth)
+        )
+
+        await self.catalog_cache.put_volatile(refreshed)
+        await self.catalog_cache.put_details(new_details)
+        await self.catalog_cache.put_thumbnails(new_thumbnails)
+
+        items_details.update(refreshed)
+        items_details.update(new_details)
+        items_thumbnails.update(new_thumbnails)
+
+        return items_details, items_thumbnails
+
+    async def __fetch_items(self, ignored_items: Optional[Set[int]] = None, *,
+                            on_type_loaded: Optional[Callable[[int], Any]] = None) -> AsyncGenerator:
         Display.info("Loading your inventory")
-        user_items = await AssetsLoader(get_user_inventory, ITEM_TYPES.keys()).load(self.auth)
-        if not user_items:
-            Display.exception("You dont have any limited UGC items")
+        pages = asyncio.Queue()
+        lookups: Dict[str, Task] = {}
+        hydrating: Dict[Task, int] = {}
+        paged: Set[int] = set()
+
+        def check_loaded(item_type: int) -> None:
+            if on_type_loaded is not None and item_type in paged and item_type not in hydrating.values():
+                on_type_loaded(item_type)
+
+        async def hydrate_page(page: List[InventoryAsset]) -> List[tuple]:
+            page = [asset for asset in page if asset.asset_id not in (ignored_items or ())]
+            item_ids = list(dict.fromkeys(str(asset.asset_id) for asset in page))
+
+            new_ids = {str(asset.asset_id): asset.collectible_item_id
+                       for asset in page if str(asset.asset_id) not in lookups}
+            if new_ids:
+                lookup = asyncio.create_task(self.__lookup_assets(new_ids))
+                lookups.update(dict.fromkeys(new_ids, lookup))
+
+            items_details, items_thumbnails = {}, {}
+            for lookup in {lookups[item_id] for item_id in item_ids}:
+                details, thumbnails = await lookup
+                items_details.update(details)
+                items_thumbnails.update(thumbnails)
+
+            return [
+                (asset, items_details[str(asset.asset_id)], items_thumbnails.get(str(asset.asset_id)))
+                for asset in page if str(asset.asset_id) in items_details
+            ]
+
+        async def load_pages(item_type: int) -> None:
+            async for page in iter_user_inventory(item_type, self.auth):
+                pages.put_nowait((item_type, page))
+
+            pages.put_nowait((item_type, None))
+
+        loaders = asyncio.gather(*(load_pages(item_type) for item_type in ITEM_TYPES))
+        loaders.add_done_callback(lambda _: pages.put_nowait(None))
+
+        next_page = asyncio.create_task(pages.get())
+        pending = {next_page}
+        total = 0
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task is not next_page:
+                        item_type = hydrating.pop(task)
 
-        item_ids = [str(asset["assetId"]) for asset in user_items]
+                        for item_info in task.result():
+                            yield item_type, *item_info
 
-        Display.info("Loading items thumbnails")
-        items_thumbnails = await AssetsLoader(get_assets_thumbnails, item_ids, 100).load(self.auth)
+                        check_loaded(item_type)
+                        continue
+
+                    entry = task.result()
+                    if entry is None:
+                        continue
+
+                    item_type, page = entry
+                    next_page = asyncio.create_task(pages.get())
+                    pending.add(next_page)
+
+                    if page is None:
+                        paged.add(item_type)
+                        check_loaded(item_type)
+                        continue
 
-        Display.info(f"Found {len(user_items)} items. Checking them...")
-        items_details = await AssetsLoader(get_items_details, item_ids, 120).load(self.auth)
+                    total += len(page)
 
-        for item_info in zip(user_items, items_details, items_thumbnails):
-            yield item_info
+                    hydrate = asyncio.create_task(hydrate_page(page))
+                    hydrating.update({hydrate: item_type})
+                    pending.add(hydrate)
+        finally:
+            for task in (*pending, *lookups.values()):
+                task.cancel()
+
+            if not loaders.done():
+                loaders.cancel()
+
+        await loaders
+
+        if self.catalog_cache is not None:
+            await self.catalog_cache.flush()
+
+        if not total:
+            Display.exception("You dont have any limited UGC items")
 
-    async def _load_items(self) -> None:
+        Display.info(f"Found {total} items")
+
+    async def _load_items(self, on_item: Optional[Callable[[Item], Any]] = None) -> None:
         if self.loaded_time is not None:
             return Display.exception("You have already loaded items")
 
+        self.loaded_time = datetime.now()
+
         Display.info("Getting current limiteds cap")
-        items_cap = await get_current_cap(self.auth)
+        self.items_cap = await get_current_cap(self.auth)
+        self.pricing.update_floors(self.items_cap)
 
-        ignored_items = list(self.seen | self.blacklist | self.not_resable)
+        ignored_items = self.seen | self.blacklist | self.not_resable
+        loading: Dict[int, List[Item]] = {}
 
-        async for item, item_details, thumbnail in self.__fetch_items():
-            item_id = item["assetId"]
+        def feed_loaded(item_type: int) -> None:
+            for loaded in loading.pop(item_type, ()):
+                on_item(loaded)
 
-            if (
-                item_id in ignored_items
-                or item_details["creatorTargetId"] in self.creators_blacklist
-            ):
+        async for item_type, item, item_details, thumbnail in self.__fetch_items(
+            ignored_items, on_type_loaded=feed_loaded if on_item is not None else None
+        ):
+            if item_details["creatorTargetId"] in self.creators_blacklist:
                 continue
 
-            item_obj = self.get_item(item_id)
+            item_obj = self.get_item(item.asset_id)
 
             if item_obj is None:
-                asset_cap = items_cap[ITEM_TYPES[item_details["assetType"]]]["priceFloor"]
-                sell_price = define_sale_price(self.under_cut_amount, self.under_cut_type,
-                                               asset_cap, item_details["lowestResalePrice"])
-
                 item_obj = Item(
-                    item, item_details,
-                    price_to_sell=sell_price,
+                    item, CatalogDetails.from_json(item_details),
                     thumbnail=thumbnail,
-                    auth=self.auth
+                    auth=self.auth,
+                    journal=self.journal,
+                    compact=self.compact_collectibles
                 )
+                item_obj.price_to_sell = self.define_price(item_obj)
                 self.add_item(item_obj)
 
+                if on_item is not None:
+                    loading.setdefault(item_type, []).append(item_obj)
+
             item_obj.add_collectible(
-                serial=item["serialNumber"],
-                item_id=item["collectibleItemId"],
-                instance_id=item["collectibleItemInstanceId"]
+                serial=item.serial,
+                item_id=item.collectible_item_id,
+                instance_id=item.instance_id
             )
 
         if not self.items:
@@ -356,7 +582,7 @@ class AutoSeller(ConfigLoader):
 
         if self.keep_serials or self.keep_copy:
             for item in self.items:
-                if len(item.collectibles) <= self.keep_copy:
+                if len(item) <= self.keep_copy:
                     self.remove_item(item.id)
                     continue
 
@@ -373,8 +599,6 @@ class AutoSeller(ConfigLoader):
             list_requirements = ", ".join(not_met)
             return Display.exception(f"You dont have any limiteds with {list_requirements}")
 
-        self.loaded_time = datetime.now()
-
     async def update_console(self) -> None:
         Tools.clear_console()
         Display.main()
@@ -421,18 +645,27 @@ class AutoSeller(ConfigLoader):
             "embeds": [embed.to_dict()]
         }
 
-        async with ClientSession() as session:
-            async with session.post(self.sale_webhook_url, json=data) as response:
-                if response.status == 429:
-                    await asyncio.sleep(30)
-                    await self.send_sale_webhook(item, sold_amount)
+        session = sessions.get("webhooks", rate_limiter=self.auth.rate_limiter)
+
+        async with session.post(self.sale_webhook_url, json=data):
+            pass
+
+    async def abort(self, message: str) -> NoReturn:
+        await self.__aexit__()
+        Display.exception(message)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, *_):
+        if self.journal is not None:
+            self.journal.close()
+
         tasks = (
             self.auth.close_session(),
+            sessions.close(),
+            self.metrics_server.stop(),
+            asyncio.to_thread(self.catalog_cache.close) if self.catalog_cache is not None else None,
             self.control_panel.message.delete() if self.control_panel else None
         )
 
@@ -455,13 +688,15 @@ async def main() -> None:
     blacklist = FileSync("blacklist/blacklist.json")
     seen = FileSync("blacklist/seen.json")
     not_resable = FileSync("blacklist/not_resable.json")
+    journal = SellJournal("blacklist/journal.jsonl")
+    catalog_cache = CatalogCache("blacklist/catalog_cache.sqlite3") if config.get("Catalog_Cache", True) else None
 
-    auto_seller = AutoSeller(config, blacklist, seen, not_resable)
+    auto_seller = AutoSeller(config, blacklist, seen, not_resable, journal, catalog_cache)
 
     try:
         await auto_seller.start()
     except:
-        return Display.exception(f"Unknown error occurred:\n\n{format_exc()}")
+        return await auto_seller.abort(f"Unknown error occurred:\n\n{format_exc()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+from .marketplace import MockMarketplace
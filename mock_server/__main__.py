@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+
+from core.visuals import Display
+
+from .marketplace import MockMarketplace
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline stand-in for the roblox endpoints used by AutoSeller")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--items", type=int, default=100, help="distinct limiteds in the inventory")
+    parser.add_argument("--copies", type=int, default=3, help="collectibles owned per limited")
+    parser.add_argument("--resellers", type=int, default=30, help="resale listings per limited")
+    parser.add_argument("--page-size", type=int, default=100, help="max inventory page size")
+    parser.add_argument("--instances-page-size", type=int, default=None, help="max resellable instances page size")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="chance of answering with 429")
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After sent with injected 429s")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    marketplace = MockMarketplace(
+        items=args.items,
+        copies=args.copies,
+        resellers=args.resellers,
+        page_size=args.page_size,
+        instances_page_size=args.instances_page_size,
+        latency=args.latency,
+        rate_limit_chance=args.rate_limit,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+
+    async with marketplace:
+        url = await marketplace.start(args.host, args.port)
+
+        Display.info(f"Mock marketplace is running on [g{url}]")
+        Display.info(f"Set [gAUTOSELLER_MOCK_URL={url}] before starting main.py to use it")
+
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
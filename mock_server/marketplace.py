@@ -0,0 +1,433 @@
+from aiohttp import web
+from collections import Counter
+from datetime import datetime, timedelta
+import asyncio
+import random
+import uuid
+
+from typing import Optional, Dict, List
+
+from core.constants import ITEM_TYPES
+
+__all__ = ("MockMarketplace",)
+
+
+class MockAsset:
+    __slots__ = ("asset_id", "collectible_item_id", "name", "asset_type",
+                 "creator_id", "creator_name", "price", "quantity",
+                 "resale_restriction", "resellers", "instances")
+
+    def __init__(self, asset_id: int, rng: random.Random) -> None:
+        self.asset_id = asset_id
+        self.collectible_item_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        self.name = f"Mock Limited #{asset_id}"
+        self.asset_type = rng.choice(list(ITEM_TYPES))
+        self.creator_id = rng.randint(1, 50)
+        self.creator_name = f"Mock Group {self.creator_id}"
+        self.price = rng.randint(50, 500)
+        self.quantity = rng.randint(100, 10000)
+        self.resale_restriction = 1 if rng.random() < 0.05 else 2
+
+        self.resellers: List[dict] = []
+        self.instances: List[dict] = []
+
+    @property
+    def lowest_resale_price(self) -> int:
+        prices = [r["price"] for r in self.resellers]
+        prices.extend(i["price"] for i in self.instances if i["saleState"] == "OnSale")
+        return min(prices, default=0)
+
+
+class MockMarketplace:
+    def __init__(
+        self,
+        *,
+        items: int = 100,
+        copies: int = 3,
+        resellers: int = 30,
+        page_size: int = 100,
+        instances_page_size: Optional[int] = None,
+        latency: float = 0.0,
+        rate_limit_chance: float = 0.0,
+        retry_after: Optional[float] = None,
+        price_floor: int = 10,
+        user_id: int = 1,
+        seed: int = 0
+    ) -> None:
+        self.page_size = page_size
+        self.instances_page_size = instances_page_size
+        self.latency = latency
+        self.rate_limit_chance = rate_limit_chance
+        self.retry_after = retry_after
+        self.price_floor = price_floor
+        self.user_id = user_id
+
+        self.csrf_token = uuid.uuid4().hex
+        self.requests = Counter()
+        self.transactions: List[dict] = []
+
+        self._rng = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+
+        self.assets: Dict[int, MockAsset] = {}
+        self._by_collectible_id: Dict[str, MockAsset] = {}
+        self._instances: Dict[str, dict] = {}
+        self._inventory_rows: Dict[int, List[dict]] = {}
+        self._build_inventory(items, copies, resellers)
+
+    def _build_inventory(self, items: int, copies: int, resellers: int) -> None:
+        rng = self._rng
+
+        for asset_id in range(10_000_000, 10_000_000 + items):
+            asset = MockAsset(asset_id, rng)
+
+            serials = rng.sample(range(1, asset.quantity + 1), min(copies + resellers, asset.quantity))
+
+            for serial in serials[:copies]:
+                instance = {
+                    "collectibleInstanceId": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "collectibleItemId": asset.collectible_item_id,
+                    "collectibleProductId": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "serialNumber": serial,
+                    "isHeld": False,
+                    "saleState": "OffSale",
+                    "price": None
+                }
+                asset.instances.append(instance)
+                self._instances.update({instance["collectibleInstanceId"]: instance})
+
+            for serial in serials[copies:]:
+                seller_id = rng.randint(100, 10 ** 9)
+                asset.resellers.append({
+                    "collectibleProductId": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "collectibleItemInstanceId": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "seller": {
+                        "hasVerifiedBadge": False,
+                        "sellerId": seller_id,
+                        "sellerType": "User",
+                        "name": f"Reseller{seller_id}"
+                    },
+                    "price": rng.randint(self.price_floor, asset.price * 4),
+                    "serialNumber": serial
+                })
+            asset.resellers.sort(key=lambda r: r["price"])
+
+            self.assets.update({asset_id: asset})
+            self._by_collectible_id.update({asset.collectible_item_id: asset})
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def _get_asset(self, request: web.Request) -> MockAsset:
+        asset = self._by_collectible_id.get(request.match_info["item_id"])
+
+        if asset is None:
+            raise web.HTTPNotFound()
+
+        return asset
+
+    @staticmethod
+    def _paginate(request: web.Request, rows: list, page_size: Optional[int]) -> Optional[dict]:
+        try:
+            limit = int(request.query.get("limit") or 10)
+            offset = int(request.query.get("cursor") or 0)
+        except ValueError:
+            return None
+
+        if page_size is not None:
+            limit = min(limit, page_size)
+
+        end = offset + limit
+
+        return {
+            "previousPageCursor": str(max(offset - limit, 0)) if offset else None,
+            "nextPageCursor": str(end) if end < len(rows) else None,
+            "data": rows[offset:end]
+        }
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        resource = request.match_info.route.resource
+        self.requests[f"{request.method} {resource.canonical if resource else request.path}"] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self._rng.random() < self.rate_limit_chance:
+            headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else None
+            return web.json_response({"errors": [{"code": 0, "message": "TooManyRequests"}]},
+                                     status=429, headers=headers)
+
+        return await handler(request)
+
+    async def authenticated(self, _: web.Request) -> web.Response:
+        return web.json_response({"id": self.user_id, "name": "MockUser", "displayName": "MockUser"})
+
+    async def validate_membership(self, _: web.Request) -> web.Response:
+        return web.json_response(True)
+
+    async def login(self, _: web.Request) -> web.Response:
+        return web.json_response({"errors": [{"code": 0, "message": "Token Validation Failed"}]},
+                                 status=403, reason="Token Validation Failed",
+                                 headers={"x-csrf-token": self.csrf_token})
+
+    def _get_inventory_rows(self, item_type: int) -> List[dict]:
+        rows = self._inventory_rows.get(item_type)
+
+        if rows is None:
+            rows = self._build_inventory_rows(item_type)
+            self._inventory_rows.update({item_type: rows})
+
+        return rows
+
+    def _build_inventory_rows(self, item_type: int) -> List[dict]:
+        return [
+            {
+                "userAssetId": abs(hash(instance["collectibleInstanceId"])),
+                "assetId": asset.asset_id,
+                "assetName": asset.name,
+                "collectibleItemId": asset.collectible_item_id,
+                "collectibleItemInstanceId": instance["collectibleInstanceId"],
+                "serialNumber": instance["serialNumber"],
+                "owner": {"userId": self.user_id, "username": "MockUser", "buildersClubMembershipType": 0},
+                "created": "2024-01-01T00:00:00.000Z",
+                "updated": "2024-01-01T00:00:00.000Z"
+            }
+            for asset in self.assets.values() if asset.asset_type == item_type
+            for instance in asset.instances
+        ]
+
+    async def inventory(self, request: web.Request) -> web.Response:
+        rows = self._get_inventory_rows(int(request.match_info["item_type"]))
+
+        page = self._paginate(request, rows, self.page_size)
+        if page is None:
+            return web.json_response({"errors": [{"code": 0, "message": "InvalidCursor"}]}, status=400)
+
+        return web.json_response(page)
+
+    async def assets_thumbnails(self, request: web.Request) -> web.Response:
+        asset_ids = [int(i) for i in request.query.get("assetIds", "").split(",") if i]
+
+        return web.json_response({"data": [
+            {"targetId": asset_id, "state": "Completed",
+             "imageUrl": f"https://tr.rbxcdn.com/mock/{asset_id}/150/150/Image/Png"}
+            for asset_id in asset_ids if asset_id in self.assets
+        ]})
+
+    async def users_thumbnails(self, request: web.Request) -> web.Response:
+        user_ids = [int(i) for i in request.query.get("userIds", "").split(",") if i]
+
+        return web.json_response({"data": [
+            {"targetId": user_id, "state": "Completed",
+             "imageUrl": f"https://tr.rbxcdn.com/mock/{user_id}/50/50/AvatarHeadshot/Png"}
+            for user_id in user_ids
+        ]})
+
+    async def catalog_details(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        details = []
+
+        for entry in payload.get("items", []):
+            asset = self.assets.get(int(entry["id"]))
+            if asset is None:
+                continue
+
+            details.append({
+                "id": asset.asset_id,
+                "itemType": "Asset",
+                "assetType": asset.asset_type,
+                "name": asset.name,
+                "creatorHasVerifiedBadge": False,
+                "creatorType": "Group",
+                "creatorTargetId": asset.creator_id,
+                "creatorName": asset.creator_name,
+                "price": asset.price,
+                "lowestPrice": asset.lowest_resale_price,
+                "lowestResalePrice": asset.lowest_resale_price,
+                "totalQuantity": asset.quantity,
+                "collectibleItemId": asset.collectible_item_id
+            })
+
+        return web.json_response({"data": details})
+
+    async def resellable_instances(self, request: web.Request) -> web.Response:
+        asset = self._get_asset(request)
+
+        page = self._paginate(request, asset.instances, self.instances_page_size)
+        if page is None:
+            return web.json_response({"errors": [{"code": 0, "message": "InvalidCursor"}]}, status=400)
+
+        page["itemInstances"] = page.pop("data")
+        return web.json_response(page)
+
+    async def resale(self, request: web.Request) -> web.Response:
+        if request.headers.get("x-csrf-token") != self.csrf_token:
+            return web.json_response({"errors": [{"code": 0, "message": "Token Validation Failed"}]},
+                                     status=403, reason="Token Validation Failed",
+                                     headers={"x-csrf-token": self.csrf_token})
+
+        asset = self._get_asset(request)
+        instance = self._instances.get(request.match_info["instance_id"])
+
+        if instance is None or instance["collectibleItemId"] != asset.collectible_item_id:
+            return web.json_response({"errors": [{"code": 0, "message": "NotFound"}]}, status=404)
+
+        if asset.resale_restriction == 1:
+            return web.json_response({"errors": [{"code": 0, "message": "Forbidden"}]}, status=403)
+
+        payload = await request.json()
+
+        if payload.get("isOnSale"):
+            if payload.get("price", 0) < self.price_floor:
+                return web.json_response({"errors": [{"code": 0, "message": "PriceTooLow"}]}, status=400)
+
+            instance.update({"saleState": "OnSale", "price": payload["price"]})
+        else:
+            instance.update({"saleState": "OffSale", "price": None})
+
+        return web.json_response({})
+
+    async def resale_data(self, request: web.Request) -> web.Response:
+        asset = self._get_asset(request)
+        rng = random.Random(asset.asset_id)
+        today = datetime(2024, 1, 1)
+
+        prices = [{"value": rng.randint(self.price_floor, asset.price * 3),
+                   "date": (today - timedelta(days=day)).strftime("%Y-%m-%dT%H:%M:%SZ")}
+                  for day in range(180)]
+        volumes = [{"value": rng.randint(0, 20), "date": point["date"]} for point in prices]
+
+        return web.json_response({
+            "assetStock": asset.quantity,
+            "sales": sum(v["value"] for v in volumes),
+            "numberRemaining": 0,
+            "recentAveragePrice": sum(p["value"] for p in prices[:30]) / 30,
+            "originalPrice": asset.price,
+            "priceDataPoints": prices,
+            "volumeDataPoints": volumes
+        })
+
+    async def resellers(self, request: web.Request) -> web.Response:
+        asset = self._get_asset(request)
+
+        page = self._paginate(request, asset.resellers, 100)
+        if page is None:
+            return web.json_response({"errors": [{"code": 0, "message": "InvalidCursor"}]}, status=400)
+
+        return web.json_response(page)
+
+    async def marketplace_details(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        details = []
+
+        for collectible_item_id in payload.get("itemIds", []):
+            asset = self._by_collectible_id.get(collectible_item_id)
+            if asset is None:
+                continue
+
+            details.append({
+                "collectibleItemId": asset.collectible_item_id,
+                "itemTargetId": asset.asset_id,
+                "itemType": "Asset",
+                "name": asset.name,
+                "creatorId": asset.creator_id,
+                "creatorType": "Group",
+                "creatorName": asset.creator_name,
+                "price": asset.price,
+                "lowestPrice": asset.lowest_resale_price,
+                "lowestResalePrice": asset.lowest_resale_price,
+                "hasResellers": bool(asset.resellers),
+                "totalQuantity": asset.quantity,
+                "resaleRestriction": asset.resale_restriction
+            })
+
+        return web.json_response(details)
+
+    async def collectibles_metadata(self, _: web.Request) -> web.Response:
+        return web.json_response({
+            "limitedItemPriceFloors": {name: {"priceFloor": self.price_floor} for name in ITEM_TYPES.values()}
+        })
+
+    async def user_transactions(self, request: web.Request) -> web.Response:
+        page = self._paginate(request, self.transactions, None)
+        if page is None:
+            return web.json_response({"errors": [{"code": 0, "message": "InvalidCursor"}]}, status=400)
+
+        return web.json_response(page)
+
+    async def webhook(self, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            return web.json_response({"id": request.match_info["webhook_id"], "name": "Mock Webhook"})
+
+        return web.Response(status=204)
+
+    def simulate_sale(self, asset_id: int, buyer_id: int = 2) -> Optional[dict]:
+        asset = self.assets.get(asset_id)
+        instance = next((i for i in asset.instances if i["saleState"] == "OnSale"), None) if asset else None
+
+        if instance is None:
+            return None
+
+        asset.instances.remove(instance)
+        self._instances.pop(instance["collectibleInstanceId"])
+        self._inventory_rows.pop(asset.asset_type, None)
+
+        transaction = {
+            "id": len(self.transactions) + 1,
+            "created": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "isPending": False,
+            "agent": {"id": buyer_id, "type": "User", "name": f"Buyer{buyer_id}"},
+            "details": {"id": asset.asset_id, "name": asset.name, "type": "Asset"},
+            "currency": {"amount": instance["price"] // 2, "type": "Robux"}
+        }
+        self.transactions.insert(0, transaction)
+
+        return transaction
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        mp = "/apis.roblox.com/marketplace-sales/v1/item/{item_id}"
+
+        app.router.add_routes([
+            web.get("/users.roblox.com/v1/users/authenticated", self.authenticated),
+            web.get("/premiumfeatures.roblox.com/v1/users/{user_id}/validate-membership", self.validate_membership),
+            web.post("/auth.roblox.com/v1/login", self.login),
+            web.get("/inventory.roblox.com/v2/users/{user_id}/inventory/{item_type}", self.inventory),
+            web.get("/thumbnails.roblox.com/v1/assets", self.assets_thumbnails),
+            web.get("/thumbnails.roblox.com/v1/users/avatar-headshot", self.users_thumbnails),
+            web.post("/catalog.roblox.com/v1/catalog/items/details", self.catalog_details),
+            web.get(f"{mp}/resellable-instances", self.resellable_instances),
+            web.patch(f"{mp}/instance/{{instance_id}}/resale", self.resale),
+            web.get(f"{mp}/resale-data", self.resale_data),
+            web.get(f"{mp}/resellers", self.resellers),
+            web.post("/apis.roblox.com/marketplace-items/v1/items/details", self.marketplace_details),
+            web.get("/itemconfiguration.roblox.com/v1/collectibles/metadata", self.collectibles_metadata),
+            web.get("/economy.roblox.com/v2/users/{user_id}/transactions", self.user_transactions),
+            web.get("/discord.com/api/webhooks/{webhook_id}/{token}", self.webhook),
+            web.post("/discord.com/api/webhooks/{webhook_id}/{token}", self.webhook)
+        ])
+
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        bound_port = site._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{bound_port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockMarketplace":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.stop()